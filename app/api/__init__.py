@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from app.api.health import router as health_router
+from app.api.payouts import router as payouts_router
+from app.api.runs import router as runs_router
+
+# Everything under /api is assembled once here; payouts come first since
+# they take the most traffic and routes are matched in order.
+api_router = APIRouter(prefix="/api")
+api_router.include_router(payouts_router)
+api_router.include_router(runs_router)
+
+__all__ = ["api_router", "health_router"]
@@ -1,26 +1,31 @@
 """
 Payout query and trace endpoints.
 
-GET /payouts           — List payouts with filters (status, country, rail).
+GET /payouts           — List payouts with filters (status, country, rail), keyset-paginated.
 GET /payouts/{id}      — Get a single payout with full details.
 GET /payouts/{id}/trace — Full audit trail for a payout.
 """
 
-import json
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import TypedDict
 
+from app.api.responses import ORJSON_OPTIONS, ORJSONResponse
 from app.database import get_session
+from app.models.enums import PAYOUT_STATUS_BY_VALUE
 from app.models.payout import AuditLog, Payout
 
 router = APIRouter(prefix="/payouts", tags=["payouts"])
 
 
-class PayoutDetail(BaseModel):
+class PayoutDetail(TypedDict):
     id: str
     run_id: Optional[str]
     liquidation_event_id: str
@@ -40,61 +45,70 @@ class PayoutDetail(BaseModel):
     skip_reason: Optional[str]
     payment_order_id: Optional[str]
     notes: Optional[str]
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
 
-    model_config = {"from_attributes": True}
 
-
-class AuditEntry(BaseModel):
+class AuditEntry(TypedDict):
     id: int
     action: str
-    details: Optional[dict] = None
-    timestamp: Optional[str]
-
-    model_config = {"from_attributes": True}
+    details: Optional[dict]
+    timestamp: Optional[datetime]
 
 
-class PayoutTrace(BaseModel):
+class PayoutTrace(TypedDict):
     payout: PayoutDetail
     audit_trail: list[AuditEntry]
 
 
-def _payout_to_detail(p: Payout) -> PayoutDetail:
-    return PayoutDetail(
-        id=p.id,
-        run_id=p.run_id,
-        liquidation_event_id=p.liquidation_event_id,
-        investor_id=p.investor_id,
-        investor_name=p.investor_name,
-        amount=p.amount,
-        currency=p.currency,
-        country=p.country,
-        payment_method=p.payment_method,
-        has_aba_routing=bool(p.has_aba_routing),
-        rail=p.rail,
-        rail_subtype=p.rail_subtype,
-        rail_currency=p.rail_currency,
-        fx_indicator=p.fx_indicator,
-        payment_order_type=p.payment_order_type,
-        status=p.status,
-        skip_reason=p.skip_reason,
-        payment_order_id=p.payment_order_id,
-        notes=p.notes,
-        created_at=p.created_at.isoformat() if p.created_at else None,
-        updated_at=p.updated_at.isoformat() if p.updated_at else None,
-    )
-
-
-@router.get("", response_model=list[PayoutDetail])
+def _payout_to_dict(p: Payout) -> PayoutDetail:
+    return {
+        "id": p.id,
+        "run_id": p.run_id,
+        "liquidation_event_id": p.liquidation_event_id,
+        "investor_id": p.investor_id,
+        "investor_name": p.investor_name,
+        "amount": p.amount,
+        "currency": p.currency,
+        "country": p.country,
+        "payment_method": p.payment_method,
+        "has_aba_routing": bool(p.has_aba_routing),
+        "rail": p.rail,
+        "rail_subtype": p.rail_subtype,
+        "rail_currency": p.rail_currency,
+        "fx_indicator": p.fx_indicator,
+        "payment_order_type": p.payment_order_type,
+        "status": p.status,
+        "skip_reason": p.skip_reason,
+        "payment_order_id": p.payment_order_id,
+        "notes": p.notes,
+        "created_at": p.created_at,
+        "updated_at": p.updated_at,
+    }
+
+
+@router.get("", response_model=None, responses={200: {"model": list[PayoutDetail]}})
 async def list_payouts(
     status: Optional[str] = Query(None, description="Filter by status"),
     country: Optional[str] = Query(None, description="Filter by country code"),
     rail: Optional[str] = Query(None, description="Filter by payment rail"),
     event_id: Optional[str] = Query(None, description="Filter by liquidation event"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum payouts per page"),
+    cursor: Optional[str] = Query(None, description="Payout ID of the last item on the previous page"),
     session: AsyncSession = Depends(get_session),
 ):
-    """List payouts with optional filters."""
+    """
+    List payouts with optional filters, newest first.
+
+    Uses keyset pagination on (created_at, id): when a page comes back full,
+    pass the last payout's id as ``cursor`` to fetch the next one. Rows are
+    streamed to the client as they are read, so memory stays flat in the
+    page size.
+    """
+    if status and status not in PAYOUT_STATUS_BY_VALUE:
+        # No payout can have an unknown status; skip the query entirely
+        return ORJSONResponse([])
+
     stmt = select(Payout)
 
     if status:
@@ -106,21 +120,47 @@ async def list_payouts(
     if event_id:
         stmt = stmt.where(Payout.liquidation_event_id == event_id)
 
-    stmt = stmt.order_by(Payout.created_at.desc())
-    result = await session.execute(stmt)
-    return [_payout_to_detail(p) for p in result.scalars().all()]
-
-
-@router.get("/{payout_id}", response_model=PayoutDetail)
+    if cursor:
+        if await session.scalar(select(Payout.id).where(Payout.id == cursor)) is None:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+        # Compare against the stored created_at in SQL: the database stamps it,
+        # and a value round-tripped through Python may not compare equal
+        # (SQLite keeps CURRENT_TIMESTAMP as text).
+        cursor_created_at = (
+            select(Payout.created_at).where(Payout.id == cursor).scalar_subquery()
+        )
+        stmt = stmt.where(
+            tuple_(Payout.created_at, Payout.id) < tuple_(cursor_created_at, cursor)
+        )
+
+    stmt = stmt.order_by(Payout.created_at.desc(), Payout.id.desc()).limit(limit)
+
+    # The generator reads from the request's session while the body streams;
+    # FastAPI >= 0.118 keeps yield dependencies open until the response is
+    # sent (0.106–0.117 closed them first), hence the floor in pyproject.
+    async def _stream() -> AsyncIterator[bytes]:
+        yield b"["
+        first = True
+        async for p in await session.stream_scalars(stmt):
+            if not first:
+                yield b","
+            first = False
+            yield orjson.dumps(_payout_to_dict(p), option=ORJSON_OPTIONS)
+        yield b"]"
+
+    return StreamingResponse(_stream(), media_type="application/json")
+
+
+@router.get("/{payout_id}", response_model=None, responses={200: {"model": PayoutDetail}})
 async def get_payout(payout_id: str, session: AsyncSession = Depends(get_session)):
     """Get a single payout with full details."""
     payout = await session.get(Payout, payout_id)
     if not payout:
         raise HTTPException(status_code=404, detail=f"Payout not found: {payout_id}")
-    return _payout_to_detail(payout)
+    return ORJSONResponse(_payout_to_dict(payout))
 
 
-@router.get("/{payout_id}/trace", response_model=PayoutTrace)
+@router.get("/{payout_id}/trace", response_model=None, responses={200: {"model": PayoutTrace}})
 async def get_payout_trace(payout_id: str, session: AsyncSession = Depends(get_session)):
     """
     Full audit trail for a payout.
@@ -136,27 +176,27 @@ async def get_payout_trace(payout_id: str, session: AsyncSession = Depends(get_s
     result = await session.execute(
         select(AuditLog)
         .where(AuditLog.payout_id == payout_id)
-        .order_by(AuditLog.timestamp.asc())
+        .order_by(AuditLog.timestamp.asc(), AuditLog.id.asc())
     )
     logs = result.scalars().all()
 
-    audit_trail = []
+    audit_trail: list[AuditEntry] = []
     for log in logs:
         details = None
         if log.details:
             try:
-                details = json.loads(log.details)
-            except (json.JSONDecodeError, TypeError):
+                details = orjson.loads(log.details)
+            except orjson.JSONDecodeError:
                 details = {"raw": log.details}
 
-        audit_trail.append(AuditEntry(
-            id=log.id,
-            action=log.action,
-            details=details,
-            timestamp=log.timestamp.isoformat() if log.timestamp else None,
-        ))
-
-    return PayoutTrace(
-        payout=_payout_to_detail(payout),
-        audit_trail=audit_trail,
-    )
+        audit_trail.append({
+            "id": log.id,
+            "action": log.action,
+            "details": details,
+            "timestamp": log.timestamp,
+        })
+
+    return ORJSONResponse({
+        "payout": _payout_to_dict(payout),
+        "audit_trail": audit_trail,
+    })
@@ -0,0 +1,25 @@
+"""Response classes shared by the API routers."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Datetimes are serialized natively by orjson. SQLite hands back naive values
+# (stored as UTC), so treat naive as UTC and emit a "Z" suffix either way.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Endpoints return this directly with plain dicts, which skips FastAPI's
+    jsonable_encoder pass and Pydantic response-model revalidation. The
+    routers therefore describe their response shapes as TypedDicts, so no
+    per-row Pydantic model is constructed; the TypedDicts are still passed
+    in `responses=` to document the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -3,18 +3,20 @@ Payout run endpoints.
 
 POST /runs  — Trigger a new payout run for a liquidation event.
 GET  /runs  — List all runs with summary stats.
-GET  /runs/{run_id} — Get detailed run status with per-payout breakdown.
+GET  /runs/{run_id} — Get run status; ?include=payouts adds the per-payout breakdown.
 """
 
-import json
+import hashlib
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from typing_extensions import TypedDict
 
+from app.api.responses import ORJSONResponse
 from app.database import get_session
 from app.engine.orchestrator import execute_run
 from app.models.payout import Payout, PayoutRun
@@ -27,7 +29,7 @@ class RunRequest(BaseModel):
     liquidation_event_id: str
 
 
-class PayoutSummary(BaseModel):
+class PayoutSummary(TypedDict):
     id: str
     investor_id: str
     investor_name: Optional[str]
@@ -40,77 +42,87 @@ class PayoutSummary(BaseModel):
     skip_reason: Optional[str]
     payment_order_id: Optional[str]
 
-    model_config = {"from_attributes": True}
 
-
-class RunResponse(BaseModel):
+class RunResponse(TypedDict):
     id: str
     liquidation_event_id: str
     status: str
     created_count: int
     skipped_count: int
     failed_count: int
-    skip_breakdown: Optional[dict] = None
-    started_at: Optional[str]
-    completed_at: Optional[str]
-    payouts: Optional[list[PayoutSummary]] = None
-
-    model_config = {"from_attributes": True}
+    skip_breakdown: Optional[dict]
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    payouts: Optional[list[PayoutSummary]]
+
+
+# Only the columns PayoutSummary needs, so rows come back as plain tuples
+# instead of fully hydrated Payout objects.
+_SUMMARY_COLUMNS = (
+    Payout.id,
+    Payout.investor_id,
+    Payout.investor_name,
+    Payout.amount_cents,
+    Payout.currency,
+    Payout.country,
+    Payout.rail,
+    Payout.payment_order_type,
+    Payout.status,
+    Payout.skip_reason,
+    Payout.payment_order_id,
+)
+
+
+def _payout_to_summary(p: Row) -> PayoutSummary:
+    return {
+        "id": p.id,
+        "investor_id": p.investor_id,
+        "investor_name": p.investor_name,
+        "amount": p.amount_cents / 100,
+        "currency": p.currency,
+        "country": p.country,
+        "rail": p.rail,
+        "payment_order_type": p.payment_order_type,
+        "status": p.status,
+        "skip_reason": p.skip_reason,
+        "payment_order_id": p.payment_order_id,
+    }
 
 
 def _run_to_response(
     run: PayoutRun,
-    payouts_list: list[Payout] | None = None,
+    payouts_list: list[Row] | None = None,
 ) -> RunResponse:
-    skip_bd = None
-    if run.skip_breakdown:
-        try:
-            skip_bd = json.loads(run.skip_breakdown)
-        except (json.JSONDecodeError, TypeError):
-            pass
-
     payouts = None
     if payouts_list is not None:
-        payouts = [
-            PayoutSummary(
-                id=p.id,
-                investor_id=p.investor_id,
-                investor_name=p.investor_name,
-                amount=p.amount,
-                currency=p.currency,
-                country=p.country,
-                rail=p.rail,
-                payment_order_type=p.payment_order_type,
-                status=p.status,
-                skip_reason=p.skip_reason,
-                payment_order_id=p.payment_order_id,
-            )
-            for p in payouts_list
-        ]
-
-    return RunResponse(
-        id=run.id,
-        liquidation_event_id=run.liquidation_event_id,
-        status=run.status,
-        created_count=run.created_count or 0,
-        skipped_count=run.skipped_count or 0,
-        failed_count=run.failed_count or 0,
-        skip_breakdown=skip_bd,
-        started_at=run.started_at.isoformat() if run.started_at else None,
-        completed_at=run.completed_at.isoformat() if run.completed_at else None,
-        payouts=payouts,
-    )
-
-
-async def _load_run_payouts(session: AsyncSession, run_id: str) -> list[Payout]:
-    """Explicitly load payouts for a run (avoids lazy loading issues)."""
-    result = await session.execute(
-        select(Payout).where(Payout.run_id == run_id).order_by(Payout.investor_id)
+        payouts = [_payout_to_summary(p) for p in payouts_list]
+
+    return {
+        "id": run.id,
+        "liquidation_event_id": run.liquidation_event_id,
+        "status": run.status,
+        "created_count": run.created_count or 0,
+        "skipped_count": run.skipped_count or 0,
+        "failed_count": run.failed_count or 0,
+        "skip_breakdown": run.skip_breakdown,
+        "started_at": run.started_at,
+        "completed_at": run.completed_at,
+        "payouts": payouts,
+    }
+
+
+async def _load_payout_summaries(session: AsyncSession, run_id: str) -> list[Row]:
+    """Stream the summary columns for a run's payouts in batches."""
+    result = await session.stream(
+        select(*_SUMMARY_COLUMNS)
+        .where(Payout.run_id == run_id)
+        .order_by(Payout.investor_id)
+        .execution_options(yield_per=500)
     )
-    return list(result.scalars().all())
+    return [row async for row in result]
 
 
-@router.post("", response_model=RunResponse, status_code=201)
+@router.post("", response_model=None, status_code=201, responses={201: {"model": RunResponse}})
 async def create_run(body: RunRequest, session: AsyncSession = Depends(get_session)):
     """
     Trigger a payout run for a liquidation event.
@@ -120,25 +132,63 @@ async def create_run(body: RunRequest, session: AsyncSession = Depends(get_sessi
     """
     provider = MockPaymentProvider()
     run = await execute_run(session, body.liquidation_event_id, provider)
-    payouts = await _load_run_payouts(session, run.id)
-    return _run_to_response(run, payouts_list=payouts)
+    payouts = await _load_payout_summaries(session, run.id)
+    return ORJSONResponse(_run_to_response(run, payouts_list=payouts), status_code=201)
 
 
-@router.get("", response_model=list[RunResponse])
+@router.get("", response_model=None, responses={200: {"model": list[RunResponse]}})
 async def list_runs(session: AsyncSession = Depends(get_session)):
     """List all payout runs with summary statistics."""
     result = await session.execute(
         select(PayoutRun).order_by(PayoutRun.started_at.desc())
     )
-    runs = result.scalars().all()
-    return [_run_to_response(r) for r in runs]
+    return ORJSONResponse([_run_to_response(r) for r in result.scalars()])
+
 
+async def _run_etag(session: AsyncSession, run: PayoutRun, include: Optional[str]) -> str:
+    """
+    Fingerprint of everything a GET /runs/{id} response is built from.
+
+    Payouts are covered by their count and latest updated_at (one aggregate
+    query), so the full breakdown is only read when the client's copy is stale.
+    """
+    parts = [
+        run.status, run.created_count, run.skipped_count, run.failed_count,
+        run.skip_breakdown, run.completed_at, include,
+    ]
+    if include == "payouts":
+        count, last_update = (await session.execute(
+            select(func.count(), func.max(Payout.updated_at)).where(Payout.run_id == run.id)
+        )).one()
+        parts += [count, last_update]
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+@router.get("/{run_id}", response_model=None, responses={200: {"model": RunResponse}, 304: {}})
+async def get_run(
+    run_id: str,
+    request: Request,
+    include: Optional[str] = Query(
+        None, description="Set to 'payouts' to include the per-payout breakdown"
+    ),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Get run status, optionally with the per-payout breakdown (?include=payouts).
 
-@router.get("/{run_id}", response_model=RunResponse)
-async def get_run(run_id: str, session: AsyncSession = Depends(get_session)):
-    """Get detailed run status including per-payout breakdown."""
+    Responses carry an ETag; pollers that send it back in If-None-Match get
+    a 304 with no body until the run or its payouts change.
+    """
     run = await session.get(PayoutRun, run_id)
     if not run:
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
-    payouts = await _load_run_payouts(session, run_id)
-    return _run_to_response(run, payouts_list=payouts)
+
+    etag = await _run_etag(session, run, include)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    payouts = None
+    if include == "payouts":
+        payouts = await _load_payout_summaries(session, run_id)
+    return ORJSONResponse(_run_to_response(run, payouts_list=payouts), headers={"ETag": etag})
@@ -12,65 +12,87 @@ These records are never modified or deleted — critical for financial
 compliance and operational debugging.
 """
 
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import insert_many
 from app.models.payout import AuditLog
 
 logger = logging.getLogger("payout_engine.audit")
 
 
-async def log_event(
-    session: AsyncSession,
+def log_event(
+    buffer: list[dict[str, Any]],
     action: str,
     run_id: Optional[str] = None,
     payout_id: Optional[str] = None,
     details: Optional[dict[str, Any]] = None,
-) -> AuditLog:
+) -> dict[str, Any]:
     """
-    Create an immutable audit log entry.
+    Record an immutable audit log entry in the run's audit buffer.
+
+    Entries are persisted in a single bulk INSERT by flush_events(), so
+    logging an event never touches the database.
 
     Args:
-        session: Database session.
+        buffer: The run's pending audit entries.
         action: What happened (e.g. "eligibility_check", "rail_selected", "payment_created").
         run_id: The orchestrator run that triggered this event.
         payout_id: The specific payout this event relates to.
         details: Arbitrary context (serialized to JSON).
 
     Returns:
-        The created AuditLog record.
+        The buffered audit row.
     """
-    entry = AuditLog(
-        run_id=run_id,
-        payout_id=payout_id,
-        action=action,
-        details=json.dumps(details) if details else None,
-        timestamp=datetime.now(timezone.utc),
-    )
-    session.add(entry)
-    logger.info(
-        "AUDIT | run=%s payout=%s action=%s | %s",
-        run_id or "-",
-        payout_id or "-",
-        action,
-        json.dumps(details)[:200] if details else "",
-    )
+    details_json = orjson.dumps(details) if details else None
+    entry = {
+        "run_id": run_id,
+        "payout_id": payout_id,
+        "action": action,
+        "details": details_json.decode() if details_json else None,
+        "timestamp": datetime.now(timezone.utc),
+    }
+    buffer.append(entry)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "AUDIT | run=%s payout=%s action=%s | %s",
+            run_id or "-",
+            payout_id or "-",
+            action,
+            details_json[:200].decode("utf-8", "replace") if details_json else "",
+        )
     return entry
 
 
-def append_note(existing_notes: Optional[str], message: str) -> str:
+async def flush_events(session: AsyncSession, buffer: list[dict[str, Any]]) -> None:
+    """
+    Persist all buffered audit entries in one INSERT and clear the buffer.
+    """
+    if not buffer:
+        return
+    await session.execute(insert_many(AuditLog), buffer)
+    buffer.clear()
+
+
+def note_prefix() -> str:
+    """Timestamp prefix for payout notes, e.g. "[2024-12-15 09:30 UTC] "."""
+    return f"[{datetime.now(timezone.utc):%Y-%m-%d %H:%M UTC}] "
+
+
+def append_note(existing_notes: Optional[str], message: str, prefix: Optional[str] = None) -> str:
     """
     Append a timestamped note to a payout's notes field.
 
     Follows the production pattern of building a running log of
     significant events on each payment record for CX visibility.
+    Callers appending many notes (e.g. a whole run) should compute
+    note_prefix() once and pass it in.
     """
-    prefix = f"[{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}] "
-    new_note = prefix + message
+    new_note = (prefix or note_prefix()) + message
     if not existing_notes:
         return new_note
     return f"{existing_notes}\n{new_note}"
@@ -1,13 +1,21 @@
 """Application configuration via environment variables."""
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./payout_engine.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_insert_page_size: int = 1000  # Rows per multi-row INSERT in bulk inserts
     log_level: str = "INFO"
     mock_failure_rate: float = 0.05  # 5% simulated failure rate
     mock_latency_ms: int = 100  # Simulated provider latency
+    mock_coalesce_latency: bool = False  # Wake concurrent mock calls in shared waves
+    payout_concurrency: int = Field(20, ge=1)  # Max in-flight provider calls per run
+    seed_chunk_size: int = Field(1000, ge=1)  # Rows per INSERT batch when seeding
+    seed_concurrency: int = Field(2, ge=1)  # Concurrent seed batches on non-SQLite databases
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
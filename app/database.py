@@ -1,16 +1,81 @@
 """Database engine and session management."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
+from sqlalchemy import Insert, event, insert, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.config import settings
 from app.models.payout import Base
 
-engine = create_async_engine(settings.database_url, echo=False)
+# Applied to every new SQLite connection. WAL lets readers proceed while a run
+# is writing; synchronous=NORMAL is durable under WAL except on power loss.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool settings; in-memory SQLite uses a single static connection instead."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and (
+        parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+    ):
+        return {"poolclass": StaticPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+
+def _json_serializer(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+# JSON columns (de)serialize through orjson instead of the stdlib json module
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    insertmanyvalues_page_size=settings.db_insert_page_size,
+    **_engine_options(settings.database_url),
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def insert_many(model: type[Base]) -> Insert:
+    """
+    ORM INSERT for executemany with rows that leave some columns None.
+
+    render_nulls sends None values as NULL parameters, so every row shares
+    one statement and the batch goes out as a single executemany; without
+    it the ORM starts a new statement at each change in which columns are
+    None.
+    """
+    return insert(model).execution_options(render_nulls=True)
+
+
 async def init_db():
     """Create all tables. Safe to call multiple times (CREATE IF NOT EXISTS)."""
     async with engine.begin() as conn:
@@ -15,13 +15,20 @@ skip reasons by category — critical for operational reporting.
 from dataclasses import dataclass
 from typing import Optional
 
-from app.models.enums import SkipReason
+from app.models.enums import (
+    SR_EXISTING_PAYMENT_ORDER,
+    SR_INVALID_AMOUNT,
+    SR_INVALID_METHOD,
+    SR_MISSING_COUNTRY,
+    SR_MISSING_EXTERNAL_ACCOUNT,
+    SkipReason,
+)
 
 
-ALLOWED_METHODS = {"ACH", "Wire"}
+ALLOWED_METHODS = frozenset({"ACH", "Wire"})
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EligibilityResult:
     """Result of an eligibility check."""
 
@@ -30,6 +37,20 @@ class EligibilityResult:
     message: str = ""
 
 
+# Results that carry no per-payout data are shared instead of rebuilt per call.
+_ELIGIBLE = EligibilityResult(eligible=True)
+_MISSING_EXTERNAL_ACCOUNT = EligibilityResult(
+    eligible=False,
+    skip_reason=SR_MISSING_EXTERNAL_ACCOUNT,
+    message="No external bank account on file",
+)
+_MISSING_COUNTRY = EligibilityResult(
+    eligible=False,
+    skip_reason=SR_MISSING_COUNTRY,
+    message="Missing country code",
+)
+
+
 def check_eligibility(
     payment_method: Optional[str],
     amount: Optional[float],
@@ -54,15 +75,15 @@ def check_eligibility(
     if existing_payment_order_id:
         return EligibilityResult(
             eligible=False,
-            skip_reason=SkipReason.EXISTING_PAYMENT_ORDER,
+            skip_reason=SR_EXISTING_PAYMENT_ORDER,
             message=f"Payment order already exists: {existing_payment_order_id}",
         )
 
     # Valid payment method
-    if not payment_method or payment_method not in ALLOWED_METHODS:
+    if payment_method not in ALLOWED_METHODS:
         return EligibilityResult(
             eligible=False,
-            skip_reason=SkipReason.INVALID_METHOD,
+            skip_reason=SR_INVALID_METHOD,
             message=f"Invalid payment method: {payment_method}",
         )
 
@@ -70,24 +91,16 @@ def check_eligibility(
     if amount is None or amount <= 0:
         return EligibilityResult(
             eligible=False,
-            skip_reason=SkipReason.INVALID_AMOUNT,
+            skip_reason=SR_INVALID_AMOUNT,
             message=f"Invalid amount: {amount}",
         )
 
     # External account required
     if not external_account_id:
-        return EligibilityResult(
-            eligible=False,
-            skip_reason=SkipReason.MISSING_EXTERNAL_ACCOUNT,
-            message="No external bank account on file",
-        )
+        return _MISSING_EXTERNAL_ACCOUNT
 
     # Country required for routing
     if not country:
-        return EligibilityResult(
-            eligible=False,
-            skip_reason=SkipReason.MISSING_COUNTRY,
-            message="Missing country code",
-        )
+        return _MISSING_COUNTRY
 
-    return EligibilityResult(eligible=True)
+    return _ELIGIBLE
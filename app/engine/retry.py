@@ -4,22 +4,27 @@ Exponential backoff retry logic for payment provider calls.
 Implements the same pattern used in production: retry on transient failures
 (429 rate limits, 503 service unavailable) with exponential backoff and
 configurable max retries. Permanent failures (4xx client errors) are not retried.
+
+Backoff is jittered (uniform between BASE_DELAY and 3x the exponential step,
+capped at MAX_DELAY) so concurrent payouts hitting the same rate limit don't
+retry in lockstep.
 """
 
 import asyncio
 import logging
-from functools import wraps
-from typing import Any, Callable, TypeVar
+import random
+from typing import Any, Callable
 
 logger = logging.getLogger("payout_engine.retry")
 
-T = TypeVar("T")
-
 RETRIABLE_STATUS_CODES = {429, 502, 503, 504}
 MAX_RETRIES = 5
 BASE_DELAY = 1.0
 MAX_DELAY = 30.0
 
+# Exponential steps per attempt: 1, 2, 4, 8, 16, 30
+_DELAYS = tuple(min(BASE_DELAY * (2**i), MAX_DELAY) for i in range(MAX_RETRIES + 1))
+
 
 class ProviderError(Exception):
     """Base exception for payment provider errors."""
@@ -45,6 +50,16 @@ class PermanentError(ProviderError):
         super().__init__(message, status_code=status_code, retriable=False)
 
 
+def _backoff(attempt: int, error: ProviderError) -> float:
+    """Jittered sleep before retry number attempt + 1."""
+    step = _DELAYS[min(attempt, len(_DELAYS) - 1)]
+    sleep_for = min(random.uniform(BASE_DELAY, step * 3), MAX_DELAY)
+    if isinstance(error, RateLimitError) and error.retry_after:
+        # Never retry sooner than the provider asked us to
+        sleep_for = max(sleep_for, min(error.retry_after, MAX_DELAY))
+    return sleep_for
+
+
 async def with_retry(
     func: Callable[..., Any],
     *args: Any,
@@ -52,7 +67,7 @@ async def with_retry(
     **kwargs: Any,
 ) -> Any:
     """
-    Execute an async function with exponential backoff on retriable errors.
+    Execute an async function with jittered exponential backoff on retriable errors.
 
     Args:
         func: Async callable to execute.
@@ -64,33 +79,31 @@ async def with_retry(
     Raises:
         ProviderError: On permanent failure or exhausted retries.
     """
-    delay = BASE_DELAY
-    last_error = None
+    # Fast path: most calls succeed first time and skip all retry bookkeeping
+    try:
+        return await func(*args, **kwargs)
+    except ProviderError as e:
+        if not e.retriable:
+            raise
+        error = e
+
+    for attempt in range(max_retries):
+        sleep_for = _backoff(attempt, error)
+        logger.warning(
+            "Retriable error on attempt %d/%d: %s — sleeping %.1fs",
+            attempt + 1,
+            max_retries + 1,
+            error,
+            sleep_for,
+        )
+        await asyncio.sleep(sleep_for)
 
-    for attempt in range(max_retries + 1):
         try:
             return await func(*args, **kwargs)
         except ProviderError as e:
-            last_error = e
             if not e.retriable:
                 raise
+            error = e
 
-            if attempt < max_retries:
-                sleep_for = min(delay, MAX_DELAY)
-                if isinstance(e, RateLimitError) and e.retry_after:
-                    sleep_for = min(e.retry_after, MAX_DELAY)
-
-                logger.warning(
-                    "Retriable error on attempt %d/%d: %s — sleeping %.1fs",
-                    attempt + 1,
-                    max_retries + 1,
-                    e,
-                    sleep_for,
-                )
-                await asyncio.sleep(sleep_for)
-                delay = min(delay * 2, MAX_DELAY)
-            else:
-                logger.error("Exhausted %d retries for provider call: %s", max_retries, e)
-                raise
-
-    raise last_error or ProviderError("Unknown error after retries")
+    logger.error("Exhausted %d retries for provider call: %s", max_retries, error)
+    raise error
@@ -17,9 +17,8 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from app.api.health import router as health_router
-from app.api.payouts import router as payouts_router
-from app.api.runs import router as runs_router
+from app.api import api_router, health_router
+from app.api.responses import ORJSONResponse
 from app.config import settings
 from app.database import init_db
 
@@ -45,8 +44,8 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.include_router(api_router)
 app.include_router(health_router)
-app.include_router(runs_router, prefix="/api")
-app.include_router(payouts_router, prefix="/api")
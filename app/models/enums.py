@@ -57,3 +57,31 @@ class SkipReason(str, Enum):
     MISSING_EXTERNAL_ACCOUNT = "missing_external_account"
     EXISTING_PAYMENT_ORDER = "existing_payment_order"
     MISSING_COUNTRY = "missing_country"
+
+
+# Module-level member aliases for hot paths: one global lookup instead of a
+# global plus an Enum class attribute lookup. Members are singletons.
+PS_PENDING = PayoutStatus.PENDING
+PS_ELIGIBLE = PayoutStatus.ELIGIBLE
+PS_PROCESSING = PayoutStatus.PROCESSING
+PS_COMPLETED = PayoutStatus.COMPLETED
+PS_FAILED = PayoutStatus.FAILED
+PS_SKIPPED = PayoutStatus.SKIPPED
+
+RS_RUNNING = RunStatus.RUNNING
+RS_COMPLETED = RunStatus.COMPLETED
+RS_FAILED = RunStatus.FAILED
+
+SR_INVALID_METHOD = SkipReason.INVALID_METHOD
+SR_WRONG_STATUS = SkipReason.WRONG_STATUS
+SR_INVALID_AMOUNT = SkipReason.INVALID_AMOUNT
+SR_MISSING_EXTERNAL_ACCOUNT = SkipReason.MISSING_EXTERNAL_ACCOUNT
+SR_EXISTING_PAYMENT_ORDER = SkipReason.EXISTING_PAYMENT_ORDER
+SR_MISSING_COUNTRY = SkipReason.MISSING_COUNTRY
+
+# Plain value → member maps for hot paths: a dict lookup skips Enum.__call__,
+# and `in` checks validate raw strings without try/except ValueError.
+PAYOUT_STATUS_BY_VALUE: dict[str, PayoutStatus] = {m.value: m for m in PayoutStatus}
+RUN_STATUS_BY_VALUE: dict[str, RunStatus] = {m.value: m for m in RunStatus}
+PAYMENT_RAIL_BY_VALUE: dict[str, PaymentRail] = {m.value: m for m in PaymentRail}
+SKIP_REASON_BY_VALUE: dict[str, SkipReason] = {m.value: m for m in SkipReason}
@@ -1,24 +1,43 @@
 """SQLAlchemy models for the payout engine."""
 
+import secrets
 import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Column,
     DateTime,
     Enum,
-    Float,
     ForeignKey,
+    Index,
     Integer,
+    JSON,
+    MetaData,
     String,
     Text,
     UniqueConstraint,
+    func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
+# Deterministic constraint/index names, so schema diffs don't churn on
+# backend-generated names.
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+
 class Base(DeclarativeBase):
-    pass
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
 
 
 def _utcnow() -> datetime:
@@ -26,7 +45,8 @@ def _utcnow() -> datetime:
 
 
 def _new_id() -> str:
-    return uuid.uuid4().hex[:12]
+    # 48 random bits as 12 hex chars, without formatting a full UUID to slice
+    return secrets.token_hex(6)
 
 
 class PayoutRun(Base):
@@ -45,10 +65,17 @@ class PayoutRun(Base):
     created_count = Column(Integer, default=0)
     skipped_count = Column(Integer, default=0)
     failed_count = Column(Integer, default=0)
-    skip_breakdown = Column(Text, nullable=True)  # JSON: {"invalid_method": 3, ...}
+    # {"invalid_method": 3, ...}; JSONB on PostgreSQL, JSON text elsewhere
+    skip_breakdown = Column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
     started_at = Column(DateTime(timezone=True), default=_utcnow)
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Not loaded anywhere; the API reads a run's payouts with its own
+    # column query. lazy="raise" keeps an accidental attribute access from
+    # issuing a query per run.
     payouts = relationship("Payout", back_populates="run", lazy="raise")
 
 
@@ -64,18 +91,24 @@ class Payout(Base):
     __tablename__ = "payouts"
     __table_args__ = (
         UniqueConstraint("liquidation_event_id", "investor_id", name="uq_event_investor"),
+        # Serve list_payouts filters + created_at DESC ordering from the index
+        Index("ix_payout_status_created", "status", "created_at"),
+        Index("ix_payout_rail", "rail"),
+        # Per-event progress queries ("payouts for event X in status Y");
+        # its leading column also serves plain event_id lookups
+        Index("ix_payout_event_status", "liquidation_event_id", "status"),
     )
 
     id = Column(String(12), primary_key=True, default=_new_id)
     run_id = Column(String(36), ForeignKey("payout_runs.id"), nullable=True)
-    liquidation_event_id = Column(String(100), nullable=False, index=True)
+    liquidation_event_id = Column(String(100), nullable=False)
     investor_id = Column(String(50), nullable=False, index=True)
     investor_name = Column(String(200), nullable=True)
-    amount = Column(Float, nullable=False)
+    amount_cents = Column(BigInteger, nullable=False)  # USD cents; source of truth for amounts
     currency = Column(String(3), default="USD")
     country = Column(String(2), nullable=True)
     payment_method = Column(String(20), nullable=True)  # ACH, Wire
-    has_aba_routing = Column(Integer, default=0)  # 1 if foreign investor w/ US bank (Wise etc.)
+    has_aba_routing = Column(Boolean, default=False)  # Foreign investor w/ US bank (Wise etc.)
     external_account_id = Column(String(100), nullable=True)
 
     # Routing result
@@ -91,12 +124,24 @@ class Payout(Base):
     payment_order_type = Column(String(50), nullable=True)  # "ACH (US)", "Cross-Border", "Wire"
     notes = Column(Text, nullable=True)
 
-    created_at = Column(DateTime(timezone=True), default=_utcnow)
-    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+    # Inserts are stamped by the database. Updates are stamped in Python:
+    # SQLite's CURRENT_TIMESTAMP only has one-second resolution, and the run
+    # ETag relies on max(updated_at) moving on every change.
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=_utcnow)
 
     run = relationship("PayoutRun", back_populates="payouts")
     audit_logs = relationship("AuditLog", back_populates="payout", lazy="raise")
 
+    @hybrid_property
+    def amount(self) -> float:
+        """Payout amount in dollars, derived from amount_cents."""
+        return self.amount_cents / 100
+
+    @amount.expression
+    def amount(cls):
+        return cls.amount_cents / 100.0
+
 
 class AuditLog(Base):
     """
@@ -108,9 +153,13 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Covers the trace endpoint: WHERE payout_id = ? ORDER BY timestamp
+        Index("ix_audit_payout_ts", "payout_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    payout_id = Column(String(12), ForeignKey("payouts.id"), nullable=True, index=True)
+    payout_id = Column(String(12), ForeignKey("payouts.id"), nullable=True)
     run_id = Column(String(36), ForeignKey("payout_runs.id"), nullable=True, index=True)
     action = Column(String(50), nullable=False)
     details = Column(Text, nullable=True)
@@ -129,7 +178,7 @@ class Investor(Base):
     country = Column(String(2), nullable=True)
     payment_method = Column(String(20), default="ACH")
     external_account_id = Column(String(100), nullable=True)
-    has_aba_routing = Column(Integer, default=0)
+    has_aba_routing = Column(Boolean, default=False)
 
 
 class LiquidationEvent(Base):
@@ -139,7 +188,16 @@ class LiquidationEvent(Base):
 
     id = Column(String(100), primary_key=True)
     name = Column(String(200), nullable=False)
-    total_amount = Column(Float, nullable=False)
+    total_amount_cents = Column(BigInteger, nullable=False)  # USD cents
     payout_date = Column(String(10), nullable=True)  # YYYY-MM-DD
     status = Column(String(20), default="pending")
-    created_at = Column(DateTime(timezone=True), default=_utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    @hybrid_property
+    def total_amount(self) -> float:
+        """Event total in dollars, derived from total_amount_cents."""
+        return self.total_amount_cents / 100
+
+    @total_amount.expression
+    def total_amount(cls):
+        return cls.total_amount_cents / 100.0
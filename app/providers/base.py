@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaymentOrderRequest:
     """Request to create a payment order."""
 
@@ -30,7 +30,7 @@ class PaymentOrderRequest:
     metadata: Optional[dict] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaymentOrderResponse:
     """Response from creating a payment order."""
 
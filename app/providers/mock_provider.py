@@ -2,7 +2,7 @@
 Mock payment provider for demonstration.
 
 Simulates real banking API behavior:
-  - Configurable latency (default 100ms)
+  - Configurable latency (default 100ms), optionally coalesced into waves
   - Configurable failure rate (default 5%)
   - Rate limiting simulation (429s)
   - Realistic payment order IDs
@@ -33,44 +33,74 @@ class MockPaymentProvider(PaymentProvider):
         self,
         failure_rate: Optional[float] = None,
         latency_ms: Optional[int] = None,
+        seed: Optional[int] = None,
+        coalesce_latency: Optional[bool] = None,
     ):
         self._failure_rate = failure_rate if failure_rate is not None else settings.mock_failure_rate
         self._latency_ms = latency_ms if latency_ms is not None else settings.mock_latency_ms
+        self._coalesce_latency = (
+            coalesce_latency if coalesce_latency is not None else settings.mock_coalesce_latency
+        )
+        self._wave: Optional[asyncio.Event] = None
+        # Per-instance generator, bound once: draws skip the module-level
+        # wrapper, and a seed makes failure sequences reproducible.
+        self._random = random.Random(seed).random
+        # Failure bands as fractions of the roll: [0, 30%) of failures are rate
+        # limits, [30%, 60%) transient errors, the rest permanent.
+        self._rate_limit_below = self._failure_rate * 0.3
+        self._transient_below = self._failure_rate * 0.6
 
     @property
     def name(self) -> str:
         return "mock_provider"
 
+    async def _wait_for_wave(self) -> None:
+        """
+        Wait for the current latency wave, opening a new one if none is pending.
+
+        Calls that arrive while a wave is pending share its single timer, so
+        a load test with thousands of in-flight calls schedules one timer per
+        wave instead of one per call.
+        """
+        wave = self._wave
+        if wave is None or wave.is_set():
+            wave = self._wave = asyncio.Event()
+            asyncio.get_running_loop().call_later(self._latency_ms * 0.001, wave.set)
+        await wave.wait()
+
     async def create_payment_order(self, request: PaymentOrderRequest) -> PaymentOrderResponse:
-        # Simulate network latency
-        if self._latency_ms > 0:
-            jitter = random.uniform(0.5, 1.5)
-            await asyncio.sleep(self._latency_ms * jitter / 1000)
-
-        # Simulate random failures
-        roll = random.random()
-
-        if roll < self._failure_rate * 0.3:
-            # Rate limit (retriable)
-            raise RateLimitError(
-                message="Mock rate limit — too many requests",
-                retry_after=1.0,
-            )
-
-        if roll < self._failure_rate * 0.6:
-            # Transient server error (retriable)
-            raise ProviderError(
-                message="Mock transient error — service temporarily unavailable",
-                status_code=503,
-                retriable=True,
-            )
-
-        if roll < self._failure_rate:
-            # Permanent failure (not retriable)
-            raise PermanentError(
-                message="Mock permanent error — invalid account details",
-                status_code=400,
-            )
+        # Simulate network latency; sub-millisecond values aren't worth an
+        # event-loop round trip
+        if self._latency_ms >= 1:
+            if self._coalesce_latency:
+                await self._wait_for_wave()
+            else:
+                await asyncio.sleep(self._latency_ms * (0.5 + self._random()) * 0.001)
+
+        # Simulate random failures; successful rolls take a single comparison
+        if self._failure_rate > 0:
+            roll = self._random()
+            if roll < self._failure_rate:
+                if roll < self._rate_limit_below:
+                    # Rate limit (retriable)
+                    raise RateLimitError(
+                        message="Mock rate limit — too many requests",
+                        retry_after=1.0,
+                    )
+
+                if roll < self._transient_below:
+                    # Transient server error (retriable)
+                    raise ProviderError(
+                        message="Mock transient error — service temporarily unavailable",
+                        status_code=503,
+                        retriable=True,
+                    )
+
+                # Permanent failure (not retriable)
+                raise PermanentError(
+                    message="Mock permanent error — invalid account details",
+                    status_code=400,
+                )
 
         # Success — generate a realistic payment order ID
         po_id = f"po_{request.payment_type}_{uuid.uuid4().hex[:16]}"
@@ -10,97 +10,102 @@ Coverage: 30+ countries across SEPA, BACS, EFT, SIC, Zengin, GIRO, CHATS,
 BECS, NEFT, ELIXIR, and more.
 """
 
-from typing import TypedDict, Optional
+from typing import NamedTuple, Optional
 
 
-class RailConfig(TypedDict, total=False):
+class RailConfig(NamedTuple):
     """Configuration for a country-specific payment rail."""
 
     type: str  # "ach", "cross_border", "wire"
     subtype: str  # Rail-specific identifier (e.g. "sepa", "bacs")
     currency: str  # ISO 4217 currency code
-    purpose: Optional[str]  # Purpose code (required by some rails, e.g. CPA for Canada)
+    purpose: Optional[str] = None  # Purpose code (required by some rails, e.g. CPA for Canada)
 
 
 GLOBAL_ACH_MAP: dict[str, RailConfig] = {
     # ─── SEPA Zone (EUR) ───────────────────────────────────────────────
     # Single Euro Payments Area — covers 19 Eurozone countries.
     # Uses IBAN-only routing. No SWIFT/BIC required.
-    "DE": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Germany
-    "FR": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # France
-    "ES": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Spain
-    "NL": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Netherlands
-    "IT": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Italy
-    "AT": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Austria
-    "BE": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Belgium
-    "IE": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Ireland
-    "PT": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Portugal
-    "FI": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Finland
-    "GR": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Greece
-    "LU": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Luxembourg
-    "CY": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Cyprus
-    "MT": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Malta
-    "SK": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Slovakia
-    "LT": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Lithuania
-    "SI": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Slovenia
-    "EE": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Estonia
-    "LV": {"type": "cross_border", "subtype": "sepa", "currency": "EUR"},  # Latvia
+    "DE": RailConfig("cross_border", "sepa", "EUR"),  # Germany
+    "FR": RailConfig("cross_border", "sepa", "EUR"),  # France
+    "ES": RailConfig("cross_border", "sepa", "EUR"),  # Spain
+    "NL": RailConfig("cross_border", "sepa", "EUR"),  # Netherlands
+    "IT": RailConfig("cross_border", "sepa", "EUR"),  # Italy
+    "AT": RailConfig("cross_border", "sepa", "EUR"),  # Austria
+    "BE": RailConfig("cross_border", "sepa", "EUR"),  # Belgium
+    "IE": RailConfig("cross_border", "sepa", "EUR"),  # Ireland
+    "PT": RailConfig("cross_border", "sepa", "EUR"),  # Portugal
+    "FI": RailConfig("cross_border", "sepa", "EUR"),  # Finland
+    "GR": RailConfig("cross_border", "sepa", "EUR"),  # Greece
+    "LU": RailConfig("cross_border", "sepa", "EUR"),  # Luxembourg
+    "CY": RailConfig("cross_border", "sepa", "EUR"),  # Cyprus
+    "MT": RailConfig("cross_border", "sepa", "EUR"),  # Malta
+    "SK": RailConfig("cross_border", "sepa", "EUR"),  # Slovakia
+    "LT": RailConfig("cross_border", "sepa", "EUR"),  # Lithuania
+    "SI": RailConfig("cross_border", "sepa", "EUR"),  # Slovenia
+    "EE": RailConfig("cross_border", "sepa", "EUR"),  # Estonia
+    "LV": RailConfig("cross_border", "sepa", "EUR"),  # Latvia
     # ─── UK (GBP) ──────────────────────────────────────────────────────
     # Bankers' Automated Clearing Services — sort code + account number.
-    "GB": {"type": "cross_border", "subtype": "bacs", "currency": "GBP"},
+    "GB": RailConfig("cross_border", "bacs", "GBP"),
     # ─── Canada (CAD) ──────────────────────────────────────────────────
     # Electronic Funds Transfer — requires CPA purpose code 250 (misc).
-    "CA": {"type": "cross_border", "subtype": "eft", "currency": "CAD", "purpose": "250"},
+    "CA": RailConfig("cross_border", "eft", "CAD", "250"),
     # ─── Switzerland (CHF) ─────────────────────────────────────────────
     # Swiss Interbank Clearing — IBAN + SWIFT required.
-    "CH": {"type": "cross_border", "subtype": "sic", "currency": "CHF"},
+    "CH": RailConfig("cross_border", "sic", "CHF"),
     # ─── Poland (PLN) ──────────────────────────────────────────────────
     # ELIXIR — Polish interbank clearing system.
-    "PL": {"type": "cross_border", "subtype": "pl_elixir", "currency": "PLN"},
+    "PL": RailConfig("cross_border", "pl_elixir", "PLN"),
     # ─── Australia (AUD) ───────────────────────────────────────────────
     # Bulk Electronic Clearing System — BSB + account number, SWIFT routing.
-    "AU": {"type": "cross_border", "subtype": "au_becs", "currency": "AUD"},
+    "AU": RailConfig("cross_border", "au_becs", "AUD"),
     # ─── Singapore (SGD) ───────────────────────────────────────────────
     # General Interbank Recurring Order — SWIFT required.
-    "SG": {"type": "cross_border", "subtype": "sg_giro", "currency": "SGD"},
+    "SG": RailConfig("cross_border", "sg_giro", "SGD"),
     # ─── India (INR) ───────────────────────────────────────────────────
     # National Electronic Funds Transfer — IFSC code, FETERS purpose codes.
-    "IN": {"type": "cross_border", "subtype": "neft", "currency": "INR"},
+    "IN": RailConfig("cross_border", "neft", "INR"),
     # ─── Japan (JPY) ───────────────────────────────────────────────────
     # Zengin System — SWIFT required, ISO purpose codes.
-    "JP": {"type": "cross_border", "subtype": "zengin", "currency": "JPY"},
+    "JP": RailConfig("cross_border", "zengin", "JPY"),
     # ─── Denmark (DKK) ─────────────────────────────────────────────────
     # Danish Interbank Clearing via Nets.
-    "DK": {"type": "cross_border", "subtype": "dk_nets", "currency": "DKK"},
+    "DK": RailConfig("cross_border", "dk_nets", "DKK"),
     # ─── New Zealand (NZD) ─────────────────────────────────────────────
     # NZ Bulk Electronic Clearing System — SWIFT required.
-    "NZ": {"type": "cross_border", "subtype": "nz_becs", "currency": "NZD"},
+    "NZ": RailConfig("cross_border", "nz_becs", "NZD"),
     # ─── Norway (NOK) ──────────────────────────────────────────────────
     # Norwegian Interbank Clearing System — IBAN + SWIFT.
-    "NO": {"type": "cross_border", "subtype": "nics", "currency": "NOK"},
+    "NO": RailConfig("cross_border", "nics", "NOK"),
     # ─── Hong Kong (HKD) ──────────────────────────────────────────────
     # Clearing House Automated Transfer System.
-    "HK": {"type": "cross_border", "subtype": "chats", "currency": "HKD"},
+    "HK": RailConfig("cross_border", "chats", "HKD"),
     # ─── Sweden (SEK) ──────────────────────────────────────────────────
     # Swedish Bankgirot — SWIFT required.
-    "SE": {"type": "cross_border", "subtype": "se_bankgirot", "currency": "SEK"},
+    "SE": RailConfig("cross_border", "se_bankgirot", "SEK"),
     # ─── Romania (RON) ─────────────────────────────────────────────────
     # SENT — Romanian interbank clearing. IBAN + SWIFT required.
-    "RO": {"type": "cross_border", "subtype": "ro_sent", "currency": "RON"},
+    "RO": RailConfig("cross_border", "ro_sent", "RON"),
     # ─── Mexico (MXN) ──────────────────────────────────────────────────
     # CCEN (SPEI) — requires 18-digit CLABE number.
-    "MX": {"type": "cross_border", "subtype": "mx_ccen", "currency": "MXN"},
+    "MX": RailConfig("cross_border", "mx_ccen", "MXN"),
     # ─── Israel (ILS) ──────────────────────────────────────────────────
     # MASAV — Israeli automated banking system. IBAN + SWIFT.
-    "IL": {"type": "cross_border", "subtype": "masav", "currency": "ILS"},
+    "IL": RailConfig("cross_border", "masav", "ILS"),
     # ─── Indonesia (IDR) ───────────────────────────────────────────────
     # SKNBI — Indonesian clearing system. SKNBI code required.
-    "ID": {"type": "cross_border", "subtype": "sknbi", "currency": "IDR"},
+    "ID": RailConfig("cross_border", "sknbi", "IDR"),
     # ─── Hungary (HUF) ─────────────────────────────────────────────────
     # Hungarian Interbank Clearing System.
-    "HU": {"type": "cross_border", "subtype": "hu_ics", "currency": "HUF"},
+    "HU": RailConfig("cross_border", "hu_ics", "HUF"),
 }
 
 
 # Convenience set of all supported destination countries
-SUPPORTED_COUNTRIES = {"US"} | set(GLOBAL_ACH_MAP.keys())
+SUPPORTED_COUNTRIES: frozenset[str] = frozenset({"US", *GLOBAL_ACH_MAP})
+
+# Countries routed over SEPA, derived from the map so the two can't drift
+SEPA_COUNTRIES: frozenset[str] = frozenset(
+    country for country, cfg in GLOBAL_ACH_MAP.items() if cfg.subtype == "sepa"
+)
@@ -17,14 +17,15 @@ amount is fixed and the recipient gets the equivalent in local currency.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
-from app.routing.country_rails import GLOBAL_ACH_MAP
+from app.routing.country_rails import GLOBAL_ACH_MAP, SUPPORTED_COUNTRIES
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RailDecision:
-    """Result of the rail selection process."""
+    """Result of the rail selection process. Shared between callers, so immutable."""
 
     payment_type: str  # "ach", "cross_border", "wire"
     subtype: Optional[str]  # e.g. "CCD", "sepa", "bacs"
@@ -56,8 +57,19 @@ def select_rail(
     Returns:
         RailDecision with the selected payment type, currency, and metadata.
     """
-    country = (country_code or "").strip().upper()
-
+    # Stored codes are already normalized, so try the raw value first and
+    # only strip/uppercase on a miss.
+    decision = _RAIL_TABLE.get((country_code, has_aba_routing))
+    if decision is None:
+        country = (country_code or "").strip().upper()
+        decision = _RAIL_TABLE.get((country, has_aba_routing))
+        if decision is None:
+            decision = _decide_unknown(country, bool(has_aba_routing))
+    return decision
+
+
+def _decide(country: str, has_aba_routing: bool) -> RailDecision:
+    """Routing rules for a normalized country code."""
     # Priority 1: Foreign investor with US bank account → domestic ACH
     # This handles Wise, Mercury, and similar multi-currency account providers
     if has_aba_routing and country != "US":
@@ -84,13 +96,13 @@ def select_rail(
     # Priority 3: Supported cross-border country → local rail
     cfg = GLOBAL_ACH_MAP.get(country)
     if cfg:
-        subtype = cfg["subtype"]
-        currency = cfg.get("currency", "USD")
+        subtype = cfg.subtype
+        currency = cfg.currency
         return RailDecision(
             payment_type="cross_border",
             subtype=subtype,
             currency=currency,
-            purpose=cfg.get("purpose"),
+            purpose=cfg.purpose,
             fx_indicator="fixed_to_variable",
             label=f"Cross-Border {subtype.upper()} ({currency})",
         )
@@ -104,3 +116,15 @@ def select_rail(
         fx_indicator=None,
         label=f"Wire (International) — {country or 'unknown'}",
     )
+
+
+# Decisions depend only on (country, has_aba_routing), so every known pair is
+# resolved once at import and select_rail becomes a dict lookup. Countries
+# outside the map still fall back to the wire rail, memoized up to a bound.
+_RAIL_TABLE: dict[tuple[str, bool], RailDecision] = {
+    (country, aba): _decide(country, aba)
+    for country in ("", *SUPPORTED_COUNTRIES)
+    for aba in (False, True)
+}
+_RAIL_TABLE.update({(None, aba): _RAIL_TABLE[("", aba)] for aba in (False, True)})
+_decide_unknown = lru_cache(maxsize=256)(_decide)
@@ -0,0 +1,64 @@
+"""
+Render the seed data as plain SQL fixture files.
+
+Writes seed/fixtures/<dialect>/<table>.sql for SQLite and PostgreSQL: one
+multi-row INSERT per file with the values inlined, headed by a checksum of
+the seed data and the tables' DDL. seed() executes matching files directly
+and falls back to bulk inserts when the checksum no longer matches, so
+rerun this after changing seed/investors.json, LIQUIDATION_EVENTS, or the
+investor/event models.
+
+Run:
+    python scripts/generate_seed_sql.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import Table, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Dialect
+
+from app.models.payout import Investor, LiquidationEvent
+from seed.seed_data import (
+    FIXTURE_CHECKSUM_PREFIX,
+    FIXTURE_TABLES,
+    LIQUIDATION_EVENTS,
+    _load_investors,
+    fixture_path,
+    seed_checksum,
+)
+
+DIALECTS: tuple[Dialect, ...] = (sqlite.dialect(), postgresql.dialect())
+
+
+def _rows(table: Table) -> list[dict]:
+    if table is Investor.__table__:
+        return [row._asdict() for row in _load_investors()]
+    if table is LiquidationEvent.__table__:
+        return [row._asdict() for row in LIQUIDATION_EVENTS]
+    raise ValueError(f"No seed rows for table {table.name}")
+
+
+def render(dialect: Dialect, table: Table, checksum: str) -> str:
+    """The fixture file contents for one table in one dialect."""
+    stmt = insert(table).values(_rows(table))
+    compiled = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    return f"{FIXTURE_CHECKSUM_PREFIX}{checksum}\n{compiled};\n"
+
+
+def main() -> None:
+    for dialect in DIALECTS:
+        checksum = seed_checksum(dialect)
+        for table in FIXTURE_TABLES:
+            path = fixture_path(dialect.name, table)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(render(dialect, table, checksum), encoding="utf-8")
+            print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+-- seed-checksum: 3c9cbd8f60b21db14a6ea3e335b982b3
+INSERT INTO investors (id, name, country, payment_method, external_account_id, has_aba_routing) VALUES ('INV-001', 'John Smith', 'US', 'ACH', 'ext_us_001', false), ('INV-002', 'Sarah Johnson', 'US', 'ACH', 'ext_us_002', false), ('INV-003', 'Michael Davis', 'US', 'ACH', 'ext_us_003', false), ('INV-004', 'Emily Wilson', 'US', 'Wire', 'ext_us_004', false), ('INV-005', 'Robert Brown', 'US', 'ACH', 'ext_us_005', false), ('INV-006', 'Jessica Martinez', 'US', 'ACH', 'ext_us_006', false), ('INV-007', 'David Lee', 'US', 'ACH', 'ext_us_007', false), ('INV-008', 'Amanda Taylor', 'US', 'ACH', 'ext_us_008', false), ('INV-010', 'Hans Mueller', 'DE', 'ACH', 'ext_de_001', false), ('INV-011', 'Pierre Dupont', 'FR', 'ACH', 'ext_fr_001', false), ('INV-012', 'Carlos Garcia', 'ES', 'ACH', 'ext_es_001', false), ('INV-013', 'Jan van der Berg', 'NL', 'ACH', 'ext_nl_001', false), ('INV-014', 'Marco Rossi', 'IT', 'ACH', 'ext_it_001', false), ('INV-015', 'Lukas Gruber', 'AT', 'ACH', 'ext_at_001', false), ('INV-016', 'Sophie Janssens', 'BE', 'ACH', 'ext_be_001', false), ('INV-017', 'Liam O''Connor', 'IE', 'ACH', 'ext_ie_001', false), ('INV-018', 'Joao Silva', 'PT', 'ACH', 'ext_pt_001', false), ('INV-019', 'Mika Virtanen', 'FI', 'ACH', 'ext_fi_001', false), ('INV-020', 'Nikos Papadopoulos', 'GR', 'Wire', 'ext_gr_001', false), ('INV-021', 'Marc Schmit', 'LU', 'ACH', 'ext_lu_001', false), ('INV-022', 'Maris Ozols', 'LV', 'ACH', 'ext_lv_001', false), ('INV-023', 'Tomas Kazlauskas', 'LT', 'ACH', 'ext_lt_001', false), ('INV-030', 'James Thompson', 'GB', 'ACH', 'ext_gb_001', false), ('INV-031', 'Charlotte Williams', 'GB', 'Wire', 'ext_gb_002', false), ('INV-032', 'Alexandre Tremblay', 'CA', 'ACH', 'ext_ca_001', false), ('INV-033', 'Felix Brunner', 'CH', 'ACH', 'ext_ch_001', false), ('INV-034', 'Piotr Kowalski', 'PL', 'ACH', 'ext_pl_001', false), ('INV-035', 'Jack Mitchell', 'AU', 'ACH', 'ext_au_001', false), ('INV-036', 'Wei Lin Tan', 'SG', 'ACH', 'ext_sg_001', false), ('INV-037', 'Raj Patel', 'IN', 'ACH', 'ext_in_001', false), ('INV-038', 'Yuki Tanaka', 'JP', 'ACH', 'ext_jp_001', false), ('INV-039', 'Lars Andersen', 'DK', 'ACH', 'ext_dk_001', false), ('INV-040', 'Olivia Campbell', 'NZ', 'ACH', 'ext_nz_001', false), ('INV-041', 'Erik Hansen', 'NO', 'ACH', 'ext_no_001', false), ('INV-042', 'Ka Wing Chan', 'HK', 'ACH', 'ext_hk_001', false), ('INV-043', 'Anna Lindqvist', 'SE', 'ACH', 'ext_se_001', false), ('INV-044', 'Andrei Popescu', 'RO', 'ACH', 'ext_ro_001', false), ('INV-045', 'Maria Hernandez', 'MX', 'ACH', 'ext_mx_001', false), ('INV-046', 'Noam Levy', 'IL', 'ACH', 'ext_il_001', false), ('INV-047', 'Budi Santoso', 'ID', 'ACH', 'ext_id_001', false), ('INV-048', 'Gabor Nagy', 'HU', 'ACH', 'ext_hu_001', false), ('INV-050', 'Kenji Watanabe', 'JP', 'ACH', 'ext_jp_wise_001', true), ('INV-051', 'Ana Soares', 'BR', 'ACH', 'ext_br_merc_001', true), ('INV-052', 'Omar Al-Rashid', 'AE', 'Wire', 'ext_ae_001', false), ('INV-053', 'Kim Soo-Jin', 'KR', 'Wire', 'ext_kr_001', false), ('INV-060', 'Ghost Investor', 'US', 'ACH', NULL, false), ('INV-061', 'Crypto Only', 'US', 'Crypto', 'ext_crypto_001', false), ('INV-062', 'Unknown Origin', NULL, 'ACH', 'ext_unknown_001', false);
@@ -0,0 +1,2 @@
+-- seed-checksum: a31f45f3fc8781911ffaabe4eca45748
+INSERT INTO investors (id, name, country, payment_method, external_account_id, has_aba_routing) VALUES ('INV-001', 'John Smith', 'US', 'ACH', 'ext_us_001', 0), ('INV-002', 'Sarah Johnson', 'US', 'ACH', 'ext_us_002', 0), ('INV-003', 'Michael Davis', 'US', 'ACH', 'ext_us_003', 0), ('INV-004', 'Emily Wilson', 'US', 'Wire', 'ext_us_004', 0), ('INV-005', 'Robert Brown', 'US', 'ACH', 'ext_us_005', 0), ('INV-006', 'Jessica Martinez', 'US', 'ACH', 'ext_us_006', 0), ('INV-007', 'David Lee', 'US', 'ACH', 'ext_us_007', 0), ('INV-008', 'Amanda Taylor', 'US', 'ACH', 'ext_us_008', 0), ('INV-010', 'Hans Mueller', 'DE', 'ACH', 'ext_de_001', 0), ('INV-011', 'Pierre Dupont', 'FR', 'ACH', 'ext_fr_001', 0), ('INV-012', 'Carlos Garcia', 'ES', 'ACH', 'ext_es_001', 0), ('INV-013', 'Jan van der Berg', 'NL', 'ACH', 'ext_nl_001', 0), ('INV-014', 'Marco Rossi', 'IT', 'ACH', 'ext_it_001', 0), ('INV-015', 'Lukas Gruber', 'AT', 'ACH', 'ext_at_001', 0), ('INV-016', 'Sophie Janssens', 'BE', 'ACH', 'ext_be_001', 0), ('INV-017', 'Liam O''Connor', 'IE', 'ACH', 'ext_ie_001', 0), ('INV-018', 'Joao Silva', 'PT', 'ACH', 'ext_pt_001', 0), ('INV-019', 'Mika Virtanen', 'FI', 'ACH', 'ext_fi_001', 0), ('INV-020', 'Nikos Papadopoulos', 'GR', 'Wire', 'ext_gr_001', 0), ('INV-021', 'Marc Schmit', 'LU', 'ACH', 'ext_lu_001', 0), ('INV-022', 'Maris Ozols', 'LV', 'ACH', 'ext_lv_001', 0), ('INV-023', 'Tomas Kazlauskas', 'LT', 'ACH', 'ext_lt_001', 0), ('INV-030', 'James Thompson', 'GB', 'ACH', 'ext_gb_001', 0), ('INV-031', 'Charlotte Williams', 'GB', 'Wire', 'ext_gb_002', 0), ('INV-032', 'Alexandre Tremblay', 'CA', 'ACH', 'ext_ca_001', 0), ('INV-033', 'Felix Brunner', 'CH', 'ACH', 'ext_ch_001', 0), ('INV-034', 'Piotr Kowalski', 'PL', 'ACH', 'ext_pl_001', 0), ('INV-035', 'Jack Mitchell', 'AU', 'ACH', 'ext_au_001', 0), ('INV-036', 'Wei Lin Tan', 'SG', 'ACH', 'ext_sg_001', 0), ('INV-037', 'Raj Patel', 'IN', 'ACH', 'ext_in_001', 0), ('INV-038', 'Yuki Tanaka', 'JP', 'ACH', 'ext_jp_001', 0), ('INV-039', 'Lars Andersen', 'DK', 'ACH', 'ext_dk_001', 0), ('INV-040', 'Olivia Campbell', 'NZ', 'ACH', 'ext_nz_001', 0), ('INV-041', 'Erik Hansen', 'NO', 'ACH', 'ext_no_001', 0), ('INV-042', 'Ka Wing Chan', 'HK', 'ACH', 'ext_hk_001', 0), ('INV-043', 'Anna Lindqvist', 'SE', 'ACH', 'ext_se_001', 0), ('INV-044', 'Andrei Popescu', 'RO', 'ACH', 'ext_ro_001', 0), ('INV-045', 'Maria Hernandez', 'MX', 'ACH', 'ext_mx_001', 0), ('INV-046', 'Noam Levy', 'IL', 'ACH', 'ext_il_001', 0), ('INV-047', 'Budi Santoso', 'ID', 'ACH', 'ext_id_001', 0), ('INV-048', 'Gabor Nagy', 'HU', 'ACH', 'ext_hu_001', 0), ('INV-050', 'Kenji Watanabe', 'JP', 'ACH', 'ext_jp_wise_001', 1), ('INV-051', 'Ana Soares', 'BR', 'ACH', 'ext_br_merc_001', 1), ('INV-052', 'Omar Al-Rashid', 'AE', 'Wire', 'ext_ae_001', 0), ('INV-053', 'Kim Soo-Jin', 'KR', 'Wire', 'ext_kr_001', 0), ('INV-060', 'Ghost Investor', 'US', 'ACH', NULL, 0), ('INV-061', 'Crypto Only', 'US', 'Crypto', 'ext_crypto_001', 0), ('INV-062', 'Unknown Origin', NULL, 'ACH', 'ext_unknown_001', 0);
@@ -0,0 +1,2 @@
+-- seed-checksum: a31f45f3fc8781911ffaabe4eca45748
+INSERT INTO liquidation_events (id, name, total_amount_cents, payout_date, status) VALUES ('LIQ-2024-001', 'Asset Liquidation #127 — Q4 2024', 245000000, '2024-12-15', 'pending'), ('LIQ-2024-002', 'Asset Liquidation #128 — Q4 2024', 89000000, '2024-12-20', 'pending');
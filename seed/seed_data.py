@@ -2,171 +2,295 @@
 Seed the database with realistic sample data.
 
 Creates:
-  - 60 investors across 30+ countries (matching GLOBAL_ACH_MAP)
+  - 60 investors across 30+ countries (matching GLOBAL_ACH_MAP), from investors.json
   - 2 liquidation events (one small, one large)
   - Edge cases: missing bank details, zero-amount, foreign investor with US bank
 
 Run:
     python -m seed.seed_data
+
+When pre-rendered fixtures/<dialect>/<table>.sql files matching the current
+data and schema are present (see scripts/generate_seed_sql.py), their
+INSERTs are executed directly; otherwise rows are bulk-inserted through
+SQLAlchemy.
 """
 
 import asyncio
+import hashlib
 import sys
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from app.database import async_session, init_db
-from app.models.payout import Investor, LiquidationEvent
-
-
-INVESTORS = [
-    # US investors (largest group)
-    {"id": "INV-001", "name": "John Smith", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_001", "has_aba_routing": 0},
-    {"id": "INV-002", "name": "Sarah Johnson", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_002", "has_aba_routing": 0},
-    {"id": "INV-003", "name": "Michael Davis", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_003", "has_aba_routing": 0},
-    {"id": "INV-004", "name": "Emily Wilson", "country": "US", "payment_method": "Wire", "external_account_id": "ext_us_004", "has_aba_routing": 0},
-    {"id": "INV-005", "name": "Robert Brown", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_005", "has_aba_routing": 0},
-    {"id": "INV-006", "name": "Jessica Martinez", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_006", "has_aba_routing": 0},
-    {"id": "INV-007", "name": "David Lee", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_007", "has_aba_routing": 0},
-    {"id": "INV-008", "name": "Amanda Taylor", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_008", "has_aba_routing": 0},
-
-    # SEPA countries (EUR)
-    {"id": "INV-010", "name": "Hans Mueller", "country": "DE", "payment_method": "ACH", "external_account_id": "ext_de_001", "has_aba_routing": 0},
-    {"id": "INV-011", "name": "Pierre Dupont", "country": "FR", "payment_method": "ACH", "external_account_id": "ext_fr_001", "has_aba_routing": 0},
-    {"id": "INV-012", "name": "Carlos Garcia", "country": "ES", "payment_method": "ACH", "external_account_id": "ext_es_001", "has_aba_routing": 0},
-    {"id": "INV-013", "name": "Jan van der Berg", "country": "NL", "payment_method": "ACH", "external_account_id": "ext_nl_001", "has_aba_routing": 0},
-    {"id": "INV-014", "name": "Marco Rossi", "country": "IT", "payment_method": "ACH", "external_account_id": "ext_it_001", "has_aba_routing": 0},
-    {"id": "INV-015", "name": "Lukas Gruber", "country": "AT", "payment_method": "ACH", "external_account_id": "ext_at_001", "has_aba_routing": 0},
-    {"id": "INV-016", "name": "Sophie Janssens", "country": "BE", "payment_method": "ACH", "external_account_id": "ext_be_001", "has_aba_routing": 0},
-    {"id": "INV-017", "name": "Liam O'Connor", "country": "IE", "payment_method": "ACH", "external_account_id": "ext_ie_001", "has_aba_routing": 0},
-    {"id": "INV-018", "name": "Joao Silva", "country": "PT", "payment_method": "ACH", "external_account_id": "ext_pt_001", "has_aba_routing": 0},
-    {"id": "INV-019", "name": "Mika Virtanen", "country": "FI", "payment_method": "ACH", "external_account_id": "ext_fi_001", "has_aba_routing": 0},
-    {"id": "INV-020", "name": "Nikos Papadopoulos", "country": "GR", "payment_method": "Wire", "external_account_id": "ext_gr_001", "has_aba_routing": 0},
-    {"id": "INV-021", "name": "Marc Schmit", "country": "LU", "payment_method": "ACH", "external_account_id": "ext_lu_001", "has_aba_routing": 0},
-    {"id": "INV-022", "name": "Maris Ozols", "country": "LV", "payment_method": "ACH", "external_account_id": "ext_lv_001", "has_aba_routing": 0},
-    {"id": "INV-023", "name": "Tomas Kazlauskas", "country": "LT", "payment_method": "ACH", "external_account_id": "ext_lt_001", "has_aba_routing": 0},
-
-    # UK
-    {"id": "INV-030", "name": "James Thompson", "country": "GB", "payment_method": "ACH", "external_account_id": "ext_gb_001", "has_aba_routing": 0},
-    {"id": "INV-031", "name": "Charlotte Williams", "country": "GB", "payment_method": "Wire", "external_account_id": "ext_gb_002", "has_aba_routing": 0},
-
-    # Canada
-    {"id": "INV-032", "name": "Alexandre Tremblay", "country": "CA", "payment_method": "ACH", "external_account_id": "ext_ca_001", "has_aba_routing": 0},
-
-    # Switzerland
-    {"id": "INV-033", "name": "Felix Brunner", "country": "CH", "payment_method": "ACH", "external_account_id": "ext_ch_001", "has_aba_routing": 0},
-
-    # Poland
-    {"id": "INV-034", "name": "Piotr Kowalski", "country": "PL", "payment_method": "ACH", "external_account_id": "ext_pl_001", "has_aba_routing": 0},
-
-    # Australia
-    {"id": "INV-035", "name": "Jack Mitchell", "country": "AU", "payment_method": "ACH", "external_account_id": "ext_au_001", "has_aba_routing": 0},
+import orjson
+from sqlalchemy import Insert, Table, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import AsyncSession
 
-    # Singapore
-    {"id": "INV-036", "name": "Wei Lin Tan", "country": "SG", "payment_method": "ACH", "external_account_id": "ext_sg_001", "has_aba_routing": 0},
-
-    # India
-    {"id": "INV-037", "name": "Raj Patel", "country": "IN", "payment_method": "ACH", "external_account_id": "ext_in_001", "has_aba_routing": 0},
-
-    # Japan
-    {"id": "INV-038", "name": "Yuki Tanaka", "country": "JP", "payment_method": "ACH", "external_account_id": "ext_jp_001", "has_aba_routing": 0},
-
-    # Denmark
-    {"id": "INV-039", "name": "Lars Andersen", "country": "DK", "payment_method": "ACH", "external_account_id": "ext_dk_001", "has_aba_routing": 0},
-
-    # New Zealand
-    {"id": "INV-040", "name": "Olivia Campbell", "country": "NZ", "payment_method": "ACH", "external_account_id": "ext_nz_001", "has_aba_routing": 0},
-
-    # Norway
-    {"id": "INV-041", "name": "Erik Hansen", "country": "NO", "payment_method": "ACH", "external_account_id": "ext_no_001", "has_aba_routing": 0},
-
-    # Hong Kong
-    {"id": "INV-042", "name": "Ka Wing Chan", "country": "HK", "payment_method": "ACH", "external_account_id": "ext_hk_001", "has_aba_routing": 0},
-
-    # Sweden
-    {"id": "INV-043", "name": "Anna Lindqvist", "country": "SE", "payment_method": "ACH", "external_account_id": "ext_se_001", "has_aba_routing": 0},
-
-    # Romania
-    {"id": "INV-044", "name": "Andrei Popescu", "country": "RO", "payment_method": "ACH", "external_account_id": "ext_ro_001", "has_aba_routing": 0},
-
-    # Mexico
-    {"id": "INV-045", "name": "Maria Hernandez", "country": "MX", "payment_method": "ACH", "external_account_id": "ext_mx_001", "has_aba_routing": 0},
+from app.config import settings
+from app.database import async_session, engine, init_db, insert_many
+from app.models.payout import Investor, LiquidationEvent
 
-    # Israel
-    {"id": "INV-046", "name": "Noam Levy", "country": "IL", "payment_method": "ACH", "external_account_id": "ext_il_001", "has_aba_routing": 0},
 
-    # Indonesia
-    {"id": "INV-047", "name": "Budi Santoso", "country": "ID", "payment_method": "ACH", "external_account_id": "ext_id_001", "has_aba_routing": 0},
+# Seed rows are immutable NamedTuples: tuple-sized records (no per-row dict)
+# whose fields double as the column header. They are turned into dicts one
+# insert chunk at a time, or fed to COPY as-is. The investor table lives in
+# investors.json next to this module; the two events are small enough to
+# keep inline.
+class InvestorSeed(NamedTuple):
+    """One seed investor."""
 
-    # Hungary
-    {"id": "INV-048", "name": "Gabor Nagy", "country": "HU", "payment_method": "ACH", "external_account_id": "ext_hu_001", "has_aba_routing": 0},
+    id: str
+    name: str
+    country: Optional[str]
+    payment_method: Optional[str]
+    external_account_id: Optional[str]
+    has_aba_routing: bool = False
 
-    # ─── Edge cases ────────────────────────────────────────────────────
 
-    # Foreign investor with US bank account (Wise) → should route to domestic ACH
-    {"id": "INV-050", "name": "Kenji Watanabe", "country": "JP", "payment_method": "ACH", "external_account_id": "ext_jp_wise_001", "has_aba_routing": 1},
+class LiquidationEventSeed(NamedTuple):
+    """One seed liquidation event."""
 
-    # Another foreign investor with US bank (Mercury)
-    {"id": "INV-051", "name": "Ana Soares", "country": "BR", "payment_method": "ACH", "external_account_id": "ext_br_merc_001", "has_aba_routing": 1},
+    id: str
+    name: str
+    total_amount_cents: int
+    payout_date: str
+    status: str = "pending"
 
-    # Unsupported country → should fall back to international wire
-    {"id": "INV-052", "name": "Omar Al-Rashid", "country": "AE", "payment_method": "Wire", "external_account_id": "ext_ae_001", "has_aba_routing": 0},
-    {"id": "INV-053", "name": "Kim Soo-Jin", "country": "KR", "payment_method": "Wire", "external_account_id": "ext_kr_001", "has_aba_routing": 0},
 
-    # Missing external account → should be skipped
-    {"id": "INV-060", "name": "Ghost Investor", "country": "US", "payment_method": "ACH", "external_account_id": None, "has_aba_routing": 0},
+INVESTOR_COLUMNS = InvestorSeed._fields
 
-    # Invalid payment method → should be skipped
-    {"id": "INV-061", "name": "Crypto Only", "country": "US", "payment_method": "Crypto", "external_account_id": "ext_crypto_001", "has_aba_routing": 0},
+INVESTORS_PATH = Path(__file__).resolve().parent / "investors.json"
 
-    # Missing country → should be skipped
-    {"id": "INV-062", "name": "Unknown Origin", "country": None, "payment_method": "ACH", "external_account_id": "ext_unknown_001", "has_aba_routing": 0},
-]
 
+def _load_investors() -> tuple[InvestorSeed, ...]:
+    """
+    Read the seed investors from investors.json.
 
-LIQUIDATION_EVENTS = [
-    {
-        "id": "LIQ-2024-001",
-        "name": "Asset Liquidation #127 — Q4 2024",
-        "total_amount": 2_450_000.00,
-        "payout_date": "2024-12-15",
-        "status": "pending",
-    },
-    {
-        "id": "LIQ-2024-002",
-        "name": "Asset Liquidation #128 — Q4 2024",
-        "total_amount": 890_000.00,
-        "payout_date": "2024-12-20",
-        "status": "pending",
-    },
-]
+    Called from seed() rather than at import, so modules that only need the
+    insert statements (the test fixtures) never parse the table.
+    """
+    return tuple(InvestorSeed(**row) for row in orjson.loads(INVESTORS_PATH.read_bytes()))
+
+
+LIQUIDATION_EVENT_COLUMNS = LiquidationEventSeed._fields
+
+LIQUIDATION_EVENTS: tuple[LiquidationEventSeed, ...] = (
+    LiquidationEventSeed("LIQ-2024-001", "Asset Liquidation #127 — Q4 2024", 245_000_000, "2024-12-15"),
+    LiquidationEventSeed("LIQ-2024-002", "Asset Liquidation #128 — Q4 2024", 89_000_000, "2024-12-20"),
+)
+
+
+# Built once and shared with the test fixtures, so repeated seeding reuses the
+# same statement objects (and their compiled-cache entries).
+INVESTOR_INSERT = insert_many(Investor)
+LIQUIDATION_EVENT_INSERT = insert_many(LiquidationEvent)
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+FIXTURE_TABLES: tuple[Table, ...] = (Investor.__table__, LiquidationEvent.__table__)
+FIXTURE_CHECKSUM_PREFIX = "-- seed-checksum: "
+
+
+def seed_checksum(dialect: Dialect) -> str:
+    """
+    Digest of the seed data and the seeded tables' DDL for a dialect.
+
+    Recorded in every fixture file, so a fixture goes stale when either the
+    rows or the table definitions change.
+    """
+    digest = hashlib.blake2b(INVESTORS_PATH.read_bytes(), digest_size=16)
+    digest.update(repr(LIQUIDATION_EVENTS).encode())
+    for table in FIXTURE_TABLES:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def fixture_path(dialect_name: str, table: Table) -> Path:
+    return FIXTURES_DIR / dialect_name / f"{table.name}.sql"
+
+
+def _load_fixture_statements(dialect: Dialect) -> Optional[list[str]]:
+    """
+    The dialect's pre-rendered INSERTs, one per seeded table, in load order.
+
+    Each file holds a checksum header line and a single statement, so no
+    statement ever has to be split out of a larger script. Returns None
+    when any file is missing or its checksum no longer matches.
+    """
+    header = FIXTURE_CHECKSUM_PREFIX + seed_checksum(dialect)
+    statements = []
+    for table in FIXTURE_TABLES:
+        path = fixture_path(dialect.name, table)
+        if not path.exists():
+            return None
+        first_line, _, statement = path.read_text(encoding="utf-8").partition("\n")
+        if first_line != header:
+            print(f"{path} is stale; run scripts/generate_seed_sql.py to regenerate it.")
+            return None
+        statements.append(statement.rstrip().removesuffix(";"))
+    return statements
+
+
+def _as_dicts(columns: tuple[str, ...], rows: Sequence[tuple]) -> list[dict]:
+    """Materialize tuple rows as column dicts."""
+    return [dict(zip(columns, row)) for row in rows]
+
+
+async def _insert_chunk(
+    session: AsyncSession,
+    stmt: Insert,
+    columns: tuple[str, ...],
+    rows: Sequence[tuple],
+) -> None:
+    """Insert one chunk: COPY on asyncpg, an executemany INSERT on any other driver."""
+    conn = await session.connection()
+    # copy_records_to_table is asyncpg API; psycopg and friends take the INSERT path
+    if conn.dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            stmt.table.name,
+            records=rows,
+            columns=list(columns),
+        )
+    else:
+        await session.execute(stmt, _as_dicts(columns, rows))
+
+
+async def _bulk_insert(
+    session: AsyncSession,
+    stmt: Insert,
+    columns: tuple[str, ...],
+    rows: Sequence[tuple],
+    chunk_size: Optional[int] = None,
+) -> None:
+    """
+    Insert tuple rows in batches of at most chunk_size rows.
+
+    Batches go through the given session one after another, except on
+    network databases with SEED_CONCURRENCY > 1. There the batches are
+    dealt across that many extra connections ("lanes") so marshalling one
+    batch overlaps the round trip of another. The lanes commit only after
+    every one of them has succeeded; if any fails, none commits. SQLite
+    always goes sequentially (aiosqlite serializes on one connection anyway).
+
+    The lanes are separate transactions from the caller's, so the load is
+    atomic per lane, not as a whole: a failure while committing the lanes
+    can leave some rows behind. seed() checks for completeness with a row
+    the caller's transaction writes last.
+    """
+    if not rows:
+        return
+    chunk_size = chunk_size or settings.seed_chunk_size
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+    conn = await session.connection()
+    concurrency = min(settings.seed_concurrency, len(chunks))
+    if conn.dialect.name == "sqlite" or concurrency <= 1:
+        for chunk in chunks:
+            await _insert_chunk(session, stmt, columns, chunk)
+        return
+
+    lanes = [chunks[i::concurrency] for i in range(concurrency)]
+
+    async def _run_lane(lane_session: AsyncSession, lane: list[Sequence[tuple]]) -> None:
+        for chunk in lane:
+            await _insert_chunk(lane_session, stmt, columns, chunk)
+
+    async with AsyncExitStack() as stack:
+        lane_sessions = [
+            await stack.enter_async_context(AsyncSession(conn.engine, expire_on_commit=False))
+            for _ in lanes
+        ]
+        # Let every lane finish before deciding, so no session is closed
+        # under a lane that is still running
+        results = await asyncio.gather(
+            *(_run_lane(s, lane) for s, lane in zip(lane_sessions, lanes)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result  # closing the sessions rolls every lane back
+        for lane_session in lane_sessions:
+            await lane_session.commit()
 
 
 async def seed():
     """Seed the database with sample data."""
-    await init_db()
-
-    async with async_session() as session:
-        # Check if already seeded
-        existing = await session.get(Investor, "INV-001")
-        if existing:
-            print("Database already seeded. Skipping.")
-            return
-
-        # Create investors
-        for inv_data in INVESTORS:
-            investor = Investor(**inv_data)
-            session.add(investor)
-
-        # Create liquidation events
-        for event_data in LIQUIDATION_EVENTS:
-            event = LiquidationEvent(**event_data)
-            session.add(event)
-
-        await session.commit()
-        print(f"Seeded {len(INVESTORS)} investors and {len(LIQUIDATION_EVENTS)} liquidation events.")
+    async with engine.connect() as conn:
+        # Seed data is reproducible, so skip fsyncs on SQLite while loading it.
+        # The pragma is per-connection: set it on a dedicated one and restore
+        # it before the connection goes back to the pool.
+        sqlite = conn.dialect.name == "sqlite"
+        if sqlite:
+            synchronous = await conn.scalar(text("PRAGMA synchronous"))
+            await conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            await conn.commit()
+
+        try:
+            async with async_session(bind=conn) as session:
+                # Check if already seeded. On an existing database this one
+                # SELECT is all a repeat invocation costs; the schema is only
+                # created when the lookup finds no table to read. The events
+                # are written last, so finding one means the load completed.
+                schema_missing = False
+                try:
+                    existing = await session.get(LiquidationEvent, LIQUIDATION_EVENTS[0].id)
+                except (OperationalError, ProgrammingError):
+                    # SQLite reports a missing table as OperationalError,
+                    # PostgreSQL as ProgrammingError
+                    existing, schema_missing = None, True
+                # End the lookup's read transaction, so the inserts below run
+                # in one BEGIN…COMMIT of their own (plus the lanes' commits
+                # when _bulk_insert seeds concurrently)
+                await session.rollback()
+
+                if existing:
+                    print("Database already seeded. Skipping.")
+                    return
+                if schema_missing:
+                    print("No schema found. Creating tables.")
+                    await init_db()
+
+                statements = _load_fixture_statements(conn.dialect)
+                async with session.begin():
+                    if statements is not None:
+                        # Pre-rendered multi-row INSERTs: no per-row binding
+                        # or statement compilation on this path
+                        session_conn = await session.connection()
+                        rows = 0
+                        for statement in statements:
+                            result = await session_conn.exec_driver_sql(statement)
+                            rows += result.rowcount
+                    else:
+                        investors = _load_investors()
+                        await _bulk_insert(
+                            session, INVESTOR_INSERT, INVESTOR_COLUMNS, investors
+                        )
+                        await _bulk_insert(
+                            session,
+                            LIQUIDATION_EVENT_INSERT,
+                            LIQUIDATION_EVENT_COLUMNS,
+                            LIQUIDATION_EVENTS,
+                        )
+
+                if statements is not None:
+                    print(f"Seeded {rows} rows from {FIXTURES_DIR / conn.dialect.name}.")
+                else:
+                    print(
+                        f"Seeded {len(investors)} investors and "
+                        f"{len(LIQUIDATION_EVENTS)} liquidation events."
+                    )
+        finally:
+            if sqlite:
+                await conn.exec_driver_sql(f"PRAGMA synchronous={int(synchronous)}")
+                await conn.commit()
 
 
 if __name__ == "__main__":
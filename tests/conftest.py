@@ -1,28 +1,94 @@
 """Shared test fixtures."""
 
-import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import aiosqlite
 import pytest
 import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database import get_session
+from app.main import app
+from app.models.payout import Base
+from app.providers.mock_provider import MockPaymentProvider
+from seed.seed_data import INVESTOR_INSERT, LIQUIDATION_EVENT_INSERT
+
 
-from app.models.payout import Base, Investor, LiquidationEvent
+# Fixture rows, built once at import and inserted with one executemany each
+TEST_INVESTORS = [
+    {"id": "INV-001", "name": "John Smith", "country": "US", "payment_method": "ACH", "external_account_id": "ext_us_001", "has_aba_routing": False},
+    {"id": "INV-010", "name": "Hans Mueller", "country": "DE", "payment_method": "ACH", "external_account_id": "ext_de_001", "has_aba_routing": False},
+    {"id": "INV-030", "name": "James Thompson", "country": "GB", "payment_method": "ACH", "external_account_id": "ext_gb_001", "has_aba_routing": False},
+    {"id": "INV-038", "name": "Yuki Tanaka", "country": "JP", "payment_method": "ACH", "external_account_id": "ext_jp_001", "has_aba_routing": False},
+    {"id": "INV-050", "name": "Kenji Watanabe", "country": "JP", "payment_method": "ACH", "external_account_id": "ext_jp_wise", "has_aba_routing": True},
+    {"id": "INV-052", "name": "Omar Al-Rashid", "country": "AE", "payment_method": "Wire", "external_account_id": "ext_ae_001", "has_aba_routing": False},
+    {"id": "INV-060", "name": "Ghost Investor", "country": "US", "payment_method": "ACH", "external_account_id": None, "has_aba_routing": False},
+    {"id": "INV-061", "name": "Crypto Only", "country": "US", "payment_method": "Crypto", "external_account_id": "ext_c_001", "has_aba_routing": False},
+]
+
+TEST_EVENTS = [
+    {"id": "LIQ-TEST-001", "name": "Test Liquidation", "total_amount_cents": 80_000_000, "payout_date": "2024-12-15"},
+]
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def mock_provider():
+    """Deterministic provider shared by all tests: no failures, no latency, so no state."""
+    return MockPaymentProvider(failure_rate=0.0, latency_ms=0)
 
 
-@pytest_asyncio.fixture
-async def db_session():
-    """Create a fresh in-memory database for each test."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+@pytest_asyncio.fixture(scope="session")
+async def schema_template():
+    """In-memory database with the schema created once for the whole session."""
+    template = await aiosqlite.connect(":memory:")
+
+    async def _template() -> aiosqlite.Connection:
+        return template
+
+    engine = create_async_engine("sqlite+aiosqlite://", async_creator=_template, poolclass=StaticPool)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    yield template
+    await engine.dispose()
+
 
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+def _session_factory(schema_template: aiosqlite.Connection):
+    """
+    Engine and session factory over one private in-memory database.
+
+    The database starts as a copy of the template. StaticPool hands every
+    session the same connection: each new connection would otherwise get
+    its own copy, and a second session would not see the first one's rows.
+    """
+
+    async def _connect() -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(":memory:", iter_chunk_size=64)
+        await schema_template.backup(conn)
+        return conn
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        async_creator=_connect,
+        poolclass=StaticPool,
+        echo=False,
+    )
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _seed(session: AsyncSession) -> None:
+    await session.execute(INVESTOR_INSERT, TEST_INVESTORS)
+    await session.execute(LIQUIDATION_EVENT_INSERT, TEST_EVENTS)
+    await session.commit()
+
+
+@pytest_asyncio.fixture
+async def db_session(schema_template: aiosqlite.Connection):
+    """Create a fresh in-memory database for each test, copied from the template."""
+    engine, session_factory = _session_factory(schema_template)
     async with session_factory() as session:
         yield session
 
@@ -32,26 +98,53 @@ async def db_session():
 @pytest_asyncio.fixture
 async def seeded_session(db_session: AsyncSession):
     """Database session pre-loaded with sample investors and events."""
-    investors = [
-        Investor(id="INV-001", name="John Smith", country="US", payment_method="ACH", external_account_id="ext_us_001"),
-        Investor(id="INV-010", name="Hans Mueller", country="DE", payment_method="ACH", external_account_id="ext_de_001"),
-        Investor(id="INV-030", name="James Thompson", country="GB", payment_method="ACH", external_account_id="ext_gb_001"),
-        Investor(id="INV-038", name="Yuki Tanaka", country="JP", payment_method="ACH", external_account_id="ext_jp_001"),
-        Investor(id="INV-050", name="Kenji Watanabe", country="JP", payment_method="ACH", external_account_id="ext_jp_wise", has_aba_routing=1),
-        Investor(id="INV-052", name="Omar Al-Rashid", country="AE", payment_method="Wire", external_account_id="ext_ae_001"),
-        Investor(id="INV-060", name="Ghost Investor", country="US", payment_method="ACH", external_account_id=None),
-        Investor(id="INV-061", name="Crypto Only", country="US", payment_method="Crypto", external_account_id="ext_c_001"),
-    ]
-    for inv in investors:
-        db_session.add(inv)
-
-    event = LiquidationEvent(
-        id="LIQ-TEST-001",
-        name="Test Liquidation",
-        total_amount=800_000.00,
-        payout_date="2024-12-15",
-    )
-    db_session.add(event)
-    await db_session.commit()
+    await _seed(db_session)
 
     yield db_session
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_seeded_session(schema_template: aiosqlite.Connection):
+    """Like seeded_session, but one database shared by every test in a module."""
+    engine, session_factory = _session_factory(schema_template)
+    async with session_factory() as session:
+        await _seed(session)
+        yield session
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def api_client(seeded_session: AsyncSession):
+    """HTTP client for the app, with every request served from seeded_session."""
+
+    async def _get_test_session():
+        yield seeded_session
+
+    app.dependency_overrides[get_session] = _get_test_session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@contextmanager
+def _count_inserts(session: AsyncSession, table: str) -> Iterator[list[int]]:
+    """Record the row count of every INSERT into `table` executed inside the block."""
+    batches: list[int] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith(f"INSERT INTO {table}"):
+            batches.append(len(parameters) if executemany else 1)
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    try:
+        yield batches
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def count_inserts():
+    """Context manager counting INSERT batches: ``with count_inserts(session, "t") as batches``."""
+    return _count_inserts
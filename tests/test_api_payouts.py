@@ -0,0 +1,49 @@
+"""API tests for the payout endpoints."""
+
+import pytest
+
+from app.engine.orchestrator import execute_run
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_every_payout_once(api_client, seeded_session, mock_provider):
+    """Keyset pages have no duplicates or gaps, even when created_at ties."""
+    await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
+
+    everything = (await api_client.get("/api/payouts", params={"limit": 1000})).json()
+    assert len(everything) == 8
+    # One run's payouts are inserted together, so they share created_at and
+    # the id tie-breaker is what keeps pages apart
+    assert len({p["created_at"] for p in everything}) < len(everything)
+
+    paged = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = await api_client.get("/api/payouts", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        paged.extend(page)
+        if len(page) < 3:
+            break
+        cursor = page[-1]["id"]
+
+    assert [p["id"] for p in paged] == [p["id"] for p in everything]
+    assert len({p["id"] for p in paged}) == 8
+
+
+@pytest.mark.asyncio
+async def test_unknown_cursor_is_rejected(api_client):
+    response = await api_client.get("/api/payouts", params={"cursor": "pay_missing"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_unknown_status_returns_empty_list(api_client, seeded_session, mock_provider):
+    await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
+
+    response = await api_client.get("/api/payouts", params={"status": "not_a_status"})
+    assert response.status_code == 200
+    assert response.json() == []
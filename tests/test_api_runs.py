@@ -0,0 +1,62 @@
+"""API tests for the run endpoints."""
+
+import pytest
+from sqlalchemy import select
+
+from app.engine.orchestrator import execute_run
+from app.models.payout import Payout
+
+
+@pytest.mark.asyncio
+async def test_get_run_etag_and_not_modified(api_client, seeded_session, mock_provider):
+    run = await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
+
+    first = await api_client.get(f"/api/runs/{run.id}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()["payouts"] is None
+
+    cached = await api_client.get(f"/api/runs/{run.id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+
+@pytest.mark.asyncio
+async def test_include_payouts(api_client, seeded_session, mock_provider):
+    run = await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
+
+    plain = await api_client.get(f"/api/runs/{run.id}")
+    detailed = await api_client.get(f"/api/runs/{run.id}", params={"include": "payouts"})
+    assert detailed.status_code == 200
+    assert detailed.headers["etag"] != plain.headers["etag"]
+
+    payouts = detailed.json()["payouts"]
+    assert len(payouts) == 8
+    assert [p["investor_id"] for p in payouts] == sorted(p["investor_id"] for p in payouts)
+    by_investor = {p["investor_id"]: p for p in payouts}
+    assert by_investor["INV-010"]["rail"] == "sepa"
+    assert by_investor["INV-060"]["skip_reason"] == "missing_external_account"
+    assert sum(p["amount"] for p in payouts) == pytest.approx(800_000)
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_after_payout_update(api_client, seeded_session, mock_provider):
+    """A payout change right after the previous one (same second) still busts the ETag."""
+    run = await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
+    params = {"include": "payouts"}
+    etag = (await api_client.get(f"/api/runs/{run.id}", params=params)).headers["etag"]
+
+    payout = await seeded_session.scalar(
+        select(Payout).where(Payout.run_id == run.id, Payout.investor_id == "INV-001")
+    )
+    payout.status = "failed"
+    await seeded_session.commit()
+
+    stale = await api_client.get(
+        f"/api/runs/{run.id}", params=params, headers={"If-None-Match": etag}
+    )
+    assert stale.status_code == 200
+    assert stale.headers["etag"] != etag
+    statuses = {p["investor_id"]: p["status"] for p in stale.json()["payouts"]}
+    assert statuses["INV-001"] == "failed"
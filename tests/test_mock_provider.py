@@ -0,0 +1,57 @@
+"""Tests for the mock payment provider."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.engine.retry import ProviderError
+from app.providers.base import PaymentOrderRequest
+from app.providers.mock_provider import MockPaymentProvider
+
+REQUEST = PaymentOrderRequest(payment_type="ach", subtype="CCD", amount_cents=10_000, currency="USD")
+
+
+async def _outcomes(provider: MockPaymentProvider, n: int) -> list[str]:
+    """Outcome of each of n sequential calls: "ok" or the error class name."""
+    outcomes = []
+    for _ in range(n):
+        try:
+            await provider.create_payment_order(REQUEST)
+            outcomes.append("ok")
+        except ProviderError as e:
+            outcomes.append(type(e).__name__)
+    return outcomes
+
+
+@pytest.mark.asyncio
+async def test_same_seed_same_outcomes():
+    first = await _outcomes(MockPaymentProvider(failure_rate=0.5, latency_ms=0, seed=42), 50)
+    second = await _outcomes(MockPaymentProvider(failure_rate=0.5, latency_ms=0, seed=42), 50)
+    other = await _outcomes(MockPaymentProvider(failure_rate=0.5, latency_ms=0, seed=7), 50)
+
+    assert first == second
+    assert first != other
+    assert "ok" in first and len(set(first)) > 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_share_one_latency_wave(monkeypatch):
+    """Concurrent calls wait on one timer and finish after about one delay."""
+    loop = asyncio.get_running_loop()
+    timers = []
+    call_later = loop.call_later
+
+    def _counting_call_later(delay, callback, *args, **kwargs):
+        timers.append(delay)
+        return call_later(delay, callback, *args, **kwargs)
+
+    monkeypatch.setattr(loop, "call_later", _counting_call_later)
+    provider = MockPaymentProvider(failure_rate=0.0, latency_ms=50, coalesce_latency=True)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(provider.create_payment_order(REQUEST) for _ in range(20)))
+    elapsed = time.perf_counter() - started
+
+    assert timers == [0.05]
+    assert 0.04 <= elapsed < 0.5
@@ -1,105 +1,128 @@
 """Integration tests for the payout orchestrator."""
 
 import pytest
-from sqlalchemy import select
+import pytest_asyncio
+from sqlalchemy import func, select
 
 from app.engine.orchestrator import execute_run
-from app.models.payout import AuditLog, Payout, PayoutRun
-from app.providers.mock_provider import MockPaymentProvider
+from app.models.payout import AuditLog, LiquidationEvent, Payout, PayoutRun
+
+
+@pytest_asyncio.fixture(scope="module")
+async def executed_run(module_seeded_session, mock_provider):
+    """One run of LIQ-TEST-001, shared by the read-only tests in this module."""
+    return await execute_run(module_seeded_session, "LIQ-TEST-001", mock_provider)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def payout_map(module_seeded_session, executed_run):
+    """Payouts of the shared run, keyed by investor id."""
+    payouts = (await module_seeded_session.execute(
+        select(Payout).where(Payout.liquidation_event_id == "LIQ-TEST-001")
+    )).scalars().all()
+    return {p.investor_id: p for p in payouts}
 
 
 @pytest.mark.asyncio
-async def test_full_run(seeded_session):
-    """Execute a full payout run and verify results."""
-    provider = MockPaymentProvider(failure_rate=0.0, latency_ms=0)
-    run = await execute_run(seeded_session, "LIQ-TEST-001", provider)
+async def test_full_run(executed_run):
+    """Execute a full payout run and verify the counts."""
+    run = executed_run
 
     assert run.status == "completed"
     assert run.created_count > 0
     assert run.skipped_count > 0  # Ghost Investor + Crypto Only should be skipped
     assert run.created_count + run.skipped_count + run.failed_count == 8  # 8 investors
 
-    # Verify specific routing
-    payouts = (await seeded_session.execute(
-        select(Payout).where(Payout.liquidation_event_id == "LIQ-TEST-001")
+
+@pytest.mark.parametrize("inv_id,expected_rail,expected_ccy", [
+    ("INV-001", "CCD", "USD"),      # US investor → ACH
+    ("INV-010", "sepa", "EUR"),     # German investor → SEPA
+    ("INV-030", "bacs", "GBP"),     # UK investor → BACS
+    ("INV-038", "zengin", "JPY"),   # Japanese investor → Zengin
+    ("INV-050", "CCD", "USD"),      # JP investor with US bank → domestic ACH
+    ("INV-052", "wire", None),      # UAE investor → Wire fallback
+])
+@pytest.mark.asyncio
+async def test_routing(payout_map, inv_id, expected_rail, expected_ccy):
+    """Each investor's payout completes on the expected rail."""
+    payout = payout_map[inv_id]
+    assert payout.status == "completed"
+    assert payout.rail == expected_rail
+    if expected_ccy is not None:
+        assert payout.rail_currency == expected_ccy
+
+
+@pytest.mark.parametrize("inv_id,expected_reason", [
+    ("INV-060", "missing_external_account"),  # Ghost Investor
+    ("INV-061", "invalid_method"),            # Crypto Only
+])
+@pytest.mark.asyncio
+async def test_skipped(payout_map, inv_id, expected_reason):
+    """Ineligible investors are skipped with the right reason."""
+    payout = payout_map[inv_id]
+    assert payout.status == "skipped"
+    assert payout.skip_reason == expected_reason
+
+
+@pytest.mark.asyncio
+async def test_audit_trail_created(module_seeded_session, executed_run):
+    """Every payout should have audit log entries."""
+    logs = (await module_seeded_session.execute(
+        select(AuditLog).where(AuditLog.run_id == executed_run.id)
     )).scalars().all()
 
-    payout_map = {p.investor_id: p for p in payouts}
-
-    # US investor → ACH
-    us = payout_map["INV-001"]
-    assert us.status == "completed"
-    assert us.rail == "CCD"
-    assert us.rail_currency == "USD"
-
-    # German investor → SEPA
-    de = payout_map["INV-010"]
-    assert de.status == "completed"
-    assert de.rail == "sepa"
-    assert de.rail_currency == "EUR"
-
-    # UK investor → BACS
-    gb = payout_map["INV-030"]
-    assert gb.status == "completed"
-    assert gb.rail == "bacs"
-    assert gb.rail_currency == "GBP"
-
-    # Japanese investor → Zengin
-    jp = payout_map["INV-038"]
-    assert jp.status == "completed"
-    assert jp.rail == "zengin"
-    assert jp.rail_currency == "JPY"
-
-    # JP investor with US bank → domestic ACH
-    jp_wise = payout_map["INV-050"]
-    assert jp_wise.status == "completed"
-    assert jp_wise.rail == "CCD"
-    assert jp_wise.rail_currency == "USD"
-
-    # UAE investor → Wire fallback
-    ae = payout_map["INV-052"]
-    assert ae.status == "completed"
-    assert ae.rail == "wire"
-
-    # Ghost Investor → skipped (missing external account)
-    ghost = payout_map["INV-060"]
-    assert ghost.status == "skipped"
-    assert ghost.skip_reason == "missing_external_account"
-
-    # Crypto Only → skipped (invalid method)
-    crypto = payout_map["INV-061"]
-    assert crypto.status == "skipped"
-    assert crypto.skip_reason == "invalid_method"
+    # Should have at least: run_started, per-payout events, run_completed
+    assert len(logs) >= 3
+
+    actions = {log.action for log in logs}
+    assert "run_started" in actions
+    assert "run_completed" in actions
+
+
+@pytest.mark.asyncio
+async def test_audit_batched(seeded_session, mock_provider, count_inserts):
+    """A run's audit entries reach the database in a single INSERT."""
+    with count_inserts(seeded_session, "audit_logs") as audit_inserts:
+        run = await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
+
+    logged = await seeded_session.scalar(
+        select(func.count()).select_from(AuditLog).where(AuditLog.run_id == run.id)
+    )
+    assert len(audit_inserts) == 1
+    assert audit_inserts[0] == logged
 
 
 @pytest.mark.asyncio
-async def test_idempotency(seeded_session):
+async def test_idempotency(seeded_session, mock_provider):
     """Running the same event twice should produce zero new payment orders."""
-    provider = MockPaymentProvider(failure_rate=0.0, latency_ms=0)
 
     # First run
-    run1 = await execute_run(seeded_session, "LIQ-TEST-001", provider)
+    run1 = await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
     assert run1.created_count > 0
 
     # Second run — should skip all (already have payment orders)
-    run2 = await execute_run(seeded_session, "LIQ-TEST-001", provider)
+    run2 = await execute_run(seeded_session, "LIQ-TEST-001", mock_provider)
     assert run2.created_count == 0
     assert run2.skipped_count > 0
 
 
 @pytest.mark.asyncio
-async def test_audit_trail_created(seeded_session):
-    """Every payout should have audit log entries."""
-    provider = MockPaymentProvider(failure_rate=0.0, latency_ms=0)
-    run = await execute_run(seeded_session, "LIQ-TEST-001", provider)
+async def test_shares_sum_to_event_total(seeded_session, mock_provider):
+    """Equal shares are computed in cents; remainder cents are not lost."""
+    seeded_session.add(LiquidationEvent(
+        id="LIQ-TEST-ODD",
+        name="Odd Total",
+        total_amount_cents=100_003,
+        payout_date="2024-12-15",
+    ))
+    await seeded_session.commit()
+
+    await execute_run(seeded_session, "LIQ-TEST-ODD", mock_provider)
 
-    logs = (await seeded_session.execute(
-        select(AuditLog).where(AuditLog.run_id == run.id)
+    payouts = (await seeded_session.execute(
+        select(Payout).where(Payout.liquidation_event_id == "LIQ-TEST-ODD")
     )).scalars().all()
 
-    # Should have at least: run_started, per-payout events, run_completed
-    assert len(logs) >= 3
-
-    actions = {log.action for log in logs}
-    assert "run_started" in actions
-    assert "run_completed" in actions
+    cents = sorted(p.amount_cents for p in payouts)
+    assert sum(cents) == 100_003
+    assert cents[-1] - cents[0] <= 1
@@ -1,7 +1,17 @@
 """Tests for the multi-rail routing engine."""
 
+import pytest
+
+from app.routing.country_rails import SEPA_COUNTRIES
 from app.routing.rail_selector import select_rail
 
+# The 19 eurozone countries, spelled out so the test does not derive its
+# expectations from the table under test
+_EXPECTED_SEPA = frozenset({
+    "AT", "BE", "CY", "DE", "EE", "ES", "FI", "FR", "GR", "IE",
+    "IT", "LT", "LU", "LV", "MT", "NL", "PT", "SI", "SK",
+})
+
 
 class TestUSPayments:
     def test_us_ach(self):
@@ -31,13 +41,14 @@ class TestSEPACountries:
         assert result.subtype == "sepa"
         assert result.currency == "EUR"
 
-    def test_all_sepa_countries(self):
-        sepa_countries = ["DE", "FR", "ES", "NL", "IT", "AT", "BE", "IE", "PT",
-                          "FI", "GR", "LU", "CY", "MT", "SK", "LT", "SI", "EE", "LV"]
-        for country in sepa_countries:
-            result = select_rail(country)
-            assert result.subtype == "sepa", f"Expected SEPA for {country}"
-            assert result.currency == "EUR", f"Expected EUR for {country}"
+    def test_sepa_zone_covers_eurozone(self):
+        assert SEPA_COUNTRIES == _EXPECTED_SEPA
+
+    @pytest.mark.parametrize("country", sorted(_EXPECTED_SEPA))
+    def test_sepa_country(self, country):
+        result = select_rail(country)
+        assert result.subtype == "sepa"
+        assert result.currency == "EUR"
 
 
 class TestCountrySpecificRails:
@@ -0,0 +1,72 @@
+"""Tests for provider retry and backoff logic."""
+
+import asyncio
+
+import pytest
+
+from app.engine.retry import (
+    BASE_DELAY,
+    MAX_DELAY,
+    PermanentError,
+    ProviderError,
+    RateLimitError,
+    with_retry,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of actually sleeping."""
+    recorded: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _failing(errors: list[Exception], result: str = "ok"):
+    calls = {"n": 0}
+
+    async def func():
+        calls["n"] += 1
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return func, calls
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_until_success(sleeps):
+    func, calls = _failing([ProviderError("503", status_code=503)] * 3)
+    assert await with_retry(func) == "ok"
+    assert calls["n"] == 4
+    assert len(sleeps) == 3
+    assert all(BASE_DELAY <= s <= MAX_DELAY for s in sleeps)
+
+
+@pytest.mark.asyncio
+async def test_permanent_error_not_retried(sleeps):
+    func, calls = _failing([PermanentError("bad account")])
+    with pytest.raises(PermanentError):
+        await with_retry(func)
+    assert calls["n"] == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_raise(sleeps):
+    func, calls = _failing([ProviderError("503", status_code=503)] * 10)
+    with pytest.raises(ProviderError):
+        await with_retry(func, max_retries=2)
+    assert calls["n"] == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_honors_retry_after(sleeps):
+    func, _ = _failing([RateLimitError(retry_after=5.0)])
+    assert await with_retry(func) == "ok"
+    assert 5.0 <= sleeps[0] <= MAX_DELAY
@@ -0,0 +1,46 @@
+"""Tests for the seed loader."""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.payout import Investor
+from seed import seed_data
+from seed.seed_data import (
+    INVESTOR_COLUMNS,
+    INVESTOR_INSERT,
+    _bulk_insert,
+    _load_fixture_statements,
+    _load_investors,
+)
+
+
+@pytest.mark.asyncio
+async def test_investors_inserted_in_one_batch(db_session, count_inserts):
+    """All seed investors go to the driver as a single batched execution."""
+    investors = _load_investors()
+    with count_inserts(db_session, "investors") as batches:
+        await _bulk_insert(db_session, INVESTOR_INSERT, INVESTOR_COLUMNS, investors)
+
+    assert batches == [len(investors)]
+    assert await db_session.scalar(select(func.count()).select_from(Investor)) == len(investors)
+
+
+@pytest.mark.parametrize("dialect", [sqlite.dialect(), postgresql.dialect()], ids=lambda d: d.name)
+def test_fixture_sql_is_current(dialect):
+    """The shipped fixture SQL matches the seed data (else run scripts/generate_seed_sql.py)."""
+    statements = _load_fixture_statements(dialect)
+    assert statements is not None
+    assert len(statements) == len(seed_data.FIXTURE_TABLES)
+
+
+def test_schema_change_makes_fixtures_stale(monkeypatch):
+    """Fixture checksums cover the tables' DDL, not just the rows."""
+    dialect = sqlite.dialect()
+    changed = Investor.__table__.to_metadata(MetaData())
+    changed.append_column(Column("extra", Integer))
+    monkeypatch.setattr(
+        seed_data, "FIXTURE_TABLES", (changed, *seed_data.FIXTURE_TABLES[1:])
+    )
+
+    assert _load_fixture_statements(dialect) is None